@@ -10,6 +10,8 @@ from .frontend.view_entry_frame import ViewEntryFrame
 
 from .other_classes.data_class import AppData
 from .other_classes.universal_handler import UniversalHandler
+from .other_classes.database_worker import DatabaseWorker
+from .other_classes.thumbnail_cache import ThumbnailCache
 
 __all__ = [
     "backend_logic",
@@ -21,5 +23,7 @@ __all__ = [
     "EditEntryFrame",
     "ViewEntryFrame",
     "AppData",
-    "UniversalHandler"
+    "UniversalHandler",
+    "DatabaseWorker",
+    "ThumbnailCache"
 ]
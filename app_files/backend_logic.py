@@ -1,10 +1,16 @@
 import sys
 from tkinter import messagebox, simpledialog
+import io
+import json
 import os
+import sqlite3
 import traceback
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine, inspect
-from sqlalchemy.orm import sessionmaker
+from PIL import Image
+from types import MappingProxyType
+from sqlalchemy import delete, func, inspect, literal, select, text, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from .database_schema import WorldBuilder
 
@@ -27,6 +33,39 @@ if not os.path.exists(path):
     os.makedirs(path)
     print(f"Folder created at: {path}")
 
+# Cache of WorldBuilder instances keyed by database url
+_WB_CACHE = {}
+
+# World names read by get_database_names, keyed by database file name: {"mtime": ..., "name": ...}
+# Loaded from and saved to WORLD_INDEX_FILE so later starts don't have to open unchanged databases
+_WORLD_NAME_CACHE = {}
+
+# File in the database folder that stores _WORLD_NAME_CACHE between runs
+WORLD_INDEX_FILE = '.worlds_index.json'
+
+
+def get_world_builder(database_url):
+    """
+    Retrieves the cached WorldBuilder for a database url, creating it on first use.
+
+    Args:
+        database_url (str): The URL of the database.
+
+    Returns:
+        WorldBuilder: The WorldBuilder instance bound to the database url.
+    """
+
+    # Check the cache for an existing WorldBuilder
+    world_builder = _WB_CACHE.get(database_url)
+
+    # If not cached, create and store it
+    if world_builder is None:
+        world_builder = WorldBuilder(database_url)
+        _WB_CACHE[database_url] = world_builder
+
+    # Return the WorldBuilder
+    return world_builder
+
 
 def find_database():
     """
@@ -38,8 +77,14 @@ def find_database():
         None
     """
 
-    # Get list of database files in the path
-    found = any(file.endswith("_database.db") for file in os.listdir(path))
+    # Scan the path, stopping at the first database file
+    try:
+        with os.scandir(path) as entries:
+            found = any(entry.name.endswith("_database.db") for entry in entries)
+
+    # No folder means no databases yet
+    except FileNotFoundError:
+        found = False
 
     # If no database files found
     if not found:
@@ -78,14 +123,20 @@ def create_database():
         return None
 
     # Set database folder to path
-    database_folder = path
+    database_folder = Path(path)
 
-    # Get database_url
-    database_url = rf'sqlite:///{database_folder}/{name.lower().replace(" ", "_")}_database.db'
+    # Get the database file path and build the url from it
+    database_path = database_folder / f'{name.lower().replace(" ", "_")}_database.db'
+    database_url = f'sqlite:///{database_path.as_posix()}'
     print(f"Database URL: {database_url}")
 
-    # Instaniate world_builder using the database url
-    world_builder = WorldBuilder(database_url=database_url)
+    # Refuse to reuse the file of an existing world, its entries would be lost on an error
+    if database_path.exists():
+        messagebox.showerror("World Exists", f"A world named '{name}' already exists.")
+        return None
+
+    # Retrieve world_builder using the database url
+    world_builder = get_world_builder(database_url)
 
     # With state to work with session and close when down
     with world_builder.get_session() as session:
@@ -109,8 +160,14 @@ def create_database():
         except SQLAlchemyError as e:
             print(f"Error: {e}")
 
+            # Release the file handles before removing the database
+            session.close()
+            world_builder.engine.dispose()
+            _WB_CACHE.pop(database_url, None)
+            WorldBuilder._created.discard(database_url)
+
             # Remove the created database
-            os.remove(database_url)
+            database_path.unlink(missing_ok=True)
 
             # Return None
             return None
@@ -148,14 +205,11 @@ def create_session_by_url(database_url):
         session: The session object.
     """
 
-    # Create engine
-    engine = create_engine(database_url)
-
-    # Create session using engine
-    session = sessionmaker(bind=engine)
+    # Reuse the cached WorldBuilder engine for the url
+    world_builder = get_world_builder(database_url)
 
     # Return session
-    return session()
+    return world_builder.get_session()
 
 def create_session_by_name(database_name):
     """
@@ -174,10 +228,109 @@ def create_session_by_name(database_name):
     # Return session using create_session_by_url
     return create_session_by_url(database_url)
 
+def _query_world_names(connection, database_files):
+    """
+    Reads the world name of each database file through one attached-database query.
+
+    Args:
+        connection (sqlite3.Connection): A connection the files can be attached to.
+        database_files (list): Paths of the database files, at most ATTACH_BATCH_SIZE.
+
+    Returns:
+        list: The world name of each file, None where it could not be read.
+    """
+
+    # Number of files attached so far
+    attached = 0
+
+    # Try block to catch files that are not world databases
+    try:
+
+        # Attach each file read only under its own schema name
+        for index, database_file in enumerate(database_files):
+            connection.execute(f"ATTACH DATABASE ? AS w{index}", (f"{database_file.as_uri()}?mode=ro",))
+            attached += 1
+
+        # Select the first world name of every attached database in one statement
+        query = " UNION ALL ".join(f"SELECT {index}, (SELECT name FROM w{index}.world LIMIT 1)"
+            for index in range(len(database_files)))
+        rows = dict(connection.execute(query).fetchall())
+
+        return [rows.get(index) for index in range(len(database_files))]
+
+    except sqlite3.DatabaseError as e:
+
+        # A single unreadable file is skipped
+        if len(database_files) == 1:
+            print(f"Error reading world name from {database_files[0]}: {e}")
+            return [None]
+
+    finally:
+
+        # Detach the files again
+        for index in range(attached):
+            connection.execute(f"DETACH DATABASE w{index}")
+
+    # Retry file by file to isolate the unreadable one
+    return [_query_world_names(connection, [database_file])[0] for database_file in database_files]
+
+def _load_world_index():
+    """
+    Loads the world names stored by an earlier run into _WORLD_NAME_CACHE, once per process.
+
+    A missing or unreadable index is ignored, the names are then read from the databases.
+
+    Returns:
+        None
+    """
+
+    # Already loaded
+    if _WORLD_NAME_CACHE:
+        return
+
+    try:
+        with open(Path(path) / WORLD_INDEX_FILE, encoding='utf-8') as file:
+            index = json.load(file)
+
+        # Keep only well formed records
+        _WORLD_NAME_CACHE.update({file_name: record for file_name, record in index.items()
+            if isinstance(record, dict) and 'mtime' in record and 'name' in record})
+
+    # No index yet, e.g. on the first run
+    except FileNotFoundError:
+        pass
+
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"World index not loaded: {e}")
+
+def _save_world_index():
+    """
+    Writes _WORLD_NAME_CACHE to the index file in the database folder.
+
+    Returns:
+        None
+    """
+
+    try:
+
+        # Write to a temporary file first so an interrupted write can't leave a broken index
+        index_path = Path(path) / WORLD_INDEX_FILE
+        temporary_path = index_path.with_suffix('.tmp')
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(_WORLD_NAME_CACHE, file)
+        os.replace(temporary_path, index_path)
+
+    except OSError as e:
+        print(f"World index not saved: {e}")
+
 def get_database_names():
     """
     This function gets the world names of all database in the database path.
 
+    The files are attached to a single in-memory SQLite connection in batches, so no engine is
+    created per file. Names are remembered per file in an index stored next to the databases, and
+    only read again once the file's modification time changes.
+
     Args:
         None
 
@@ -188,33 +341,222 @@ def get_database_names():
     # Initialize an empty dictionary to story world names and their database URLs
     names = {}
 
-    # Iterate through files in the 'db' directory
-    for file in os.listdir(path):
+    # Database files whose world name has to be read
+    database_files = []
+
+    # Names of the database files found
+    file_names = set()
 
-        # Check if the file is a database file
-        if file.endswith("_database.db"):
+    # Load the names stored by an earlier run
+    _load_world_index()
 
-            # Construct the database URL
-            database_url = f"sqlite:///{Path(path) / file}"
+    # Get the database files in the 'db' directory along with their modification times
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not (entry.name.endswith("_database.db") and entry.is_file()):
+                continue
 
-            # Create a session with the current database URL
-            session = create_session_by_url(database_url)
+            database_file = Path(entry.path)
+            mtime = entry.stat().st_mtime_ns
+            file_names.add(entry.name)
 
-            with session:
+            # Reuse the name read earlier if the file has not changed since
+            cached = _WORLD_NAME_CACHE.get(entry.name)
+            if cached and cached['mtime'] == mtime:
+                names[cached['name']] = f"sqlite:///{database_file.as_posix()}"
+                continue
 
-                # Query the first world entry in the database
-                world_entry = session.query(WorldBuilder.World).first()
+            database_files.append((database_file, mtime))
 
-                # If a world entry exists, add it to the dictionary
-                if world_entry:
-                    names[world_entry.name] = database_url
+    # Forget files that no longer exist, tracking every changed record
+    changed = set(_WORLD_NAME_CACHE) - file_names
+    for file_name in changed:
+        del _WORLD_NAME_CACHE[file_name]
 
+    # Nothing left to read
+    if not database_files:
+        if changed:
+            _save_world_index()
         return names
 
+    # One connection to attach the databases to
+    connection = sqlite3.connect(":memory:", uri=True)
+
+    try:
+
+        # Iterate through the files in batches SQLite can attach at once
+        for start in range(0, len(database_files), ATTACH_BATCH_SIZE):
+            batch = database_files[start:start + ATTACH_BATCH_SIZE]
+            world_names = _query_world_names(connection, [database_file for database_file, _ in batch])
+
+            # Add every world name found to the dictionary and remember it for the next call
+            for (database_file, mtime), world_name in zip(batch, world_names):
+                if world_name:
+                    names[world_name] = f"sqlite:///{database_file.as_posix()}"
+                    _WORLD_NAME_CACHE[database_file.name] = {'mtime': mtime, 'name': world_name}
+                    changed.add(database_file.name)
+
+    finally:
+        connection.close()
+
+    # Store the names for the next run if any changed
+    if changed:
+        _save_world_index()
+
+    return names
+
+# Prepared tag insert, duplicate rows are ignored by the unique tag index
+INSERT_TAG_SQL = ("INSERT OR IGNORE INTO tags (entry_name, entry_location, entry_table, entry_id) "
+    "VALUES (?, ?, ?, ?)")
+
+# SQLite allows at most 10 attached databases per connection by default
+ATTACH_BATCH_SIZE = 10
+
+# Chunk size used when writing blobs incrementally
+BLOB_CHUNK_SIZE = 65536
+
+# Tables that are not shown as entry categories
+EXCLUDED_TABLES = frozenset({'world', 'tags'})
+
+# Columns that are not shown as entry fields
+EXCLUDED_COLUMNS = frozenset({'id', 'thumb_data'})
+
+# Columns that have their own widgets instead of a text field
+NON_TEXT_COLUMNS = frozenset({'name', 'tags', 'image_data'})
+
+# Size of the thumbnails stored next to entry images
+THUMBNAIL_SIZE = (200, 200)
+
+
+@lru_cache(maxsize=64)
+def _cached_table_names(engine):
+    """
+    Reflects and caches the entry table names for an engine.
+
+    Args:
+        engine: The engine bound to the database.
+
+    Returns:
+        tuple: The table names, excluding EXCLUDED_TABLES.
+    """
+
+    # Get names of all the tables
+    names = inspect(engine).get_table_names()
+
+    # Remove the excluded tables
+    return tuple(name for name in names if name not in EXCLUDED_TABLES)
+
+
+@lru_cache(maxsize=64)
+def _cached_column_names(engine, table_name):
+    """
+    Reflects and caches the column names of a table for an engine.
+
+    Args:
+        engine: The engine bound to the database.
+        table_name (str): The name of the table.
+
+    Returns:
+        tuple: The column names, excluding EXCLUDED_COLUMNS.
+    """
+
+    # Get columns
+    columns = inspect(engine).get_columns(table_name)
+
+    # Remove excluded names from column names
+    return tuple(column['name'] for column in columns if column['name'] not in EXCLUDED_COLUMNS)
+
+
+@lru_cache(maxsize=64)
+def _cached_editable_columns(engine, table_name):
+    """
+    Caches the columns of a table that are edited as text fields.
+
+    Args:
+        engine: The engine bound to the database.
+        table_name (str): The name of the table.
+
+    Returns:
+        tuple: The column names, excluding NON_TEXT_COLUMNS.
+    """
+
+    return tuple(name for name in _cached_column_names(engine, table_name) if name not in NON_TEXT_COLUMNS)
+
+
+@lru_cache(maxsize=64)
+def _cached_all_tags(engine):
+    """
+    Reads and caches the tag names for an engine.
+
+    Args:
+        engine: The engine bound to the database.
+
+    Returns:
+        tuple: The entry names in the tags table.
+    """
+
+    # Get tag table
+    tag_table = WorldBuilder.get_table_class('tags')
+
+    # Query to retrieve all tags, streamed from the cursor in batches
+    statement = select(tag_table.entry_name).execution_options(yield_per=1000)
+
+    with engine.connect() as connection:
+        return tuple(connection.scalars(statement))
+
+
+@lru_cache(maxsize=64)
+def _cached_all_entry_names(engine):
+    """
+    Reads and caches the entry names of every table for an engine with a single query.
+
+    The per-table selects are combined with UNION ALL, so all categories are read in one
+    statement instead of one query per table.
+
+    Args:
+        engine: The engine bound to the database.
+
+    Returns:
+        dict: A read-only mapping of each table name to a tuple of its entry names.
+    """
+
+    # Start with an empty list for every table
+    names = {table_name: [] for table_name in _cached_table_names(engine)}
+
+    # Build one select per table that has a table class, tagged with the table name
+    selects = []
+    for table_name in names:
+        table_class = WorldBuilder.get_table_class(table_name)
+        if table_class:
+            selects.append(select(literal(table_name).label('table_name'), table_class.name))
+
+    # Query all tables at once and sort the names into their tables
+    if selects:
+        with engine.connect() as connection:
+            for table_name, name in connection.execute(union_all(*selects)):
+                names[table_name].append(name)
+
+    return MappingProxyType({table_name: tuple(entries) for table_name, entries in names.items()})
+
+
+def clear_entry_caches():
+    """
+    Clears the cached tags and entry names, called after every write to an entry.
+
+    Returns:
+        None
+    """
+
+    _cached_all_tags.cache_clear()
+    _cached_all_entry_names.cache_clear()
+
+
 def get_table_names(session):
     """
     Retrieves the names of all tables in the database.
 
+    The schema is static while the app runs, so the reflected names are cached per engine.
+
     Args:
         session: The session object.
 
@@ -225,20 +567,8 @@ def get_table_names(session):
     # Try block for error handling
     try:
 
-        # Creater inspector
-        inspector = inspect(session.bind)
-
-        # Get names of all the tables
-        names = inspector.get_table_names()
-
-        # List to exclude tables
-        excluded_tables = ['world', 'tags']
-
-        # Remove the excluded tables
-        table_names = [name for name in names if name not in excluded_tables]
-
         # Return table names
-        return table_names
+        return list(_cached_table_names(session.get_bind()))
 
     # Handle Errors
     except Exception as e:
@@ -250,6 +580,8 @@ def get_column_names(session, table_name):
     """
     Retrieves the column names of a specified table.
 
+    The schema is static while the app runs, so the reflected names are cached per engine and table.
+
     Args:
         session: The session object.
         table_name (str): The name of the table.
@@ -262,118 +594,208 @@ def get_column_names(session, table_name):
     if not table_name:
         return []
 
-    # Get engine
-    engine = session.get_bind()
+    # Return list of names
+    return list(_cached_column_names(session.get_bind(), table_name))
 
-    # Get inspector
-    inspector = inspect(engine)
+def get_editable_columns(session, table_name):
+    """
+    Retrieves the columns of a table that are shown as text fields, in table order.
 
-    # Get columns
-    columns = inspector.get_columns(table_name)
+    Name, tags and image data have their own widgets and are left out. The result is cached per engine and table,
+    so frames and saves share one pre-filtered tuple.
 
-    # Get column names
-    column_names = [column['name'] for column in columns]
+    Args:
+        session: The session object.
+        table_name (str): The name of the table.
 
-    # List of names to exclude
-    excluded_names = ['id']
+    Returns:
+        tuple: The column names.
+    """
 
-    # Remove excluded names from column names
-    names = [name for name in column_names if name not in excluded_names]
+    # If no table name return an empty tuple
+    if not table_name:
+        return ()
 
-    # Return list of names
-    return names
+    return _cached_editable_columns(session.get_bind(), table_name)
+
+def create_thumbnail_image(image_data):
+    """
+    Decodes the image data and shrinks it to fit THUMBNAIL_SIZE, keeping its aspect ratio.
+
+    Only PIL is used here, so this is safe to call from a worker thread.
+
+    Args:
+        image_data (bytes): The raw image data.
+
+    Returns:
+        Image.Image: The thumbnail.
+    """
+
+    # Open the image using PIL, closing it once the thumbnail is made
+    with Image.open(io.BytesIO(image_data)) as image:
+
+        # Let JPEGs decode at a reduced scale, no smaller than twice the thumbnail
+        image.draft('RGB', (THUMBNAIL_SIZE[0] * 2, THUMBNAIL_SIZE[1] * 2))
+
+        # LANCZOS is only worth its cost when shrinking a large image, use BILINEAR otherwise
+        if max(image.size) > 2 * max(THUMBNAIL_SIZE):
+            resample = Image.Resampling.LANCZOS
+        else:
+            resample = Image.Resampling.BILINEAR
+
+        # Shrink in place, images that already fit such as stored thumbnails are not resampled
+        image.thumbnail(THUMBNAIL_SIZE, resample)
+
+        # Copy the pixels before the file is closed
+        return image.copy()
+
+def create_thumbnail(image_data):
+    """
+    Creates the PNG thumbnail stored next to an entry image.
+
+    Args:
+        image_data (bytes): The raw image data.
+
+    Returns:
+        bytes: The thumbnail as PNG data.
+    """
+
+    # Save the thumbnail as PNG
+    buffer = io.BytesIO()
+    create_thumbnail_image(image_data).save(buffer, 'PNG', optimize=True)
+
+    return buffer.getvalue()
+
+class EntryExistsError(Exception):
+    """
+    Raised by add_data_to_table with on_conflict='error' when an entry with the same name exists.
+    """
 
-def add_data_to_table(session, table_name, data_dict, database_url):
+def add_data_to_table(session, table_name, data_dict, database_url, on_conflict='skip'):
     """
     Adds or updates data in the specified table.
 
+    No user interaction happens here; the transaction is always finished before returning so a caller
+    can prompt the user and call again with on_conflict='update'.
+
     Args:
         session: The session object.
         table_name (str): The name of the table.
         data_dict (dict): A dictionary containing the data to be added or updated.
         database_url (str): The URL of the database.
+        on_conflict (str): What to do when an entry with the same name exists:
+            'update' overwrites it, 'skip' leaves it unchanged, 'error' raises EntryExistsError.
 
     Returns:
-        None
+        str or None: 'added', 'updated' or 'exists' (entry left unchanged), None if an error occurred.
     """
 
     # Try block to catch errors
     try:
 
         # Create instance of WorldBuilder
-        world_builder = WorldBuilder(database_url)
+        world_builder = get_world_builder(database_url)
 
-        # Get tag table
-        tag_table = world_builder.get_table_class('tags')
+        # Strip and dedupe the tags, keeping the order they were entered in
+        tags = dict.fromkeys(tag.strip() for tag in data_dict['tags'].split(",") if tag.strip())
+        data_dict = {**data_dict, 'tags': ", ".join(tags)}
 
         # Get the table class
         main_table_class = world_builder.get_table_class(table_name)
 
-        # Query the table for existing data of dictionary
-        existing_entry = session.query(main_table_class).filter_by(name=data_dict['name']).first()
+        # Store a thumbnail next to the image so views don't decode the full image,
+        # it is only created once the row is known to be written
+        store_thumbnail = 'image_data' in data_dict and hasattr(main_table_class, 'thumb_data')
 
-        # Check for exsisting entry
-        if existing_entry:
+        # Insert statement for the entry, keyed on the unique name column
+        insert_statement = sqlite_insert(main_table_class.__table__).values(**data_dict)
 
-            # Ask the user if they want to update the data
-            update_data = messagebox.askyesno("Update Entry", "Entry already exists. Do you want to update the data?")
+        # Try to insert the entry, leaving any existing entry with the same name untouched
+        result = session.execute(insert_statement.on_conflict_do_nothing(index_elements=['name']))
+
+        # Check for exsisting entry
+        if result.rowcount == 0:
 
-            # If the user selects "ok"
-            if update_data:
+            # If the caller chose to overwrite existing entries
+            if on_conflict == 'update':
                 print("Updating data...")
 
-                # Update the existing entry if the user chooses to do so
-                for key, value in data_dict.items():
-                    setattr(existing_entry, key, value)
+                # Replace the thumbnail along with the image
+                if store_thumbnail:
+                    image_data = data_dict['image_data']
+                    data_dict = {**data_dict, 'thumb_data': create_thumbnail(image_data) if image_data else None}
+                    insert_statement = sqlite_insert(main_table_class.__table__).values(**data_dict)
+
+                # Update the existing entry in place with an upsert
+                session.execute(insert_statement.on_conflict_do_update(index_elements=['name'],
+                    set_={key: insert_statement.excluded[key] for key in data_dict if key != 'name'}))
 
                 # Commit changes
                 session.commit()
+                clear_entry_caches()
+
+                # The upsert bypasses the identity map, drop loaded objects so they are re-read
+                session.expire_all()
 
                 print("Data updated successfully!")
+                return 'updated'
 
-            else:
-                print("Data not updated.")
+            print("Data not updated.")
 
-        # If no data in the database
-        else:
+            # End the transaction opened by the insert attempt
+            session.rollback()
 
-            # Create a new entry if it doesn't exist
-            new_entry = main_table_class(**data_dict)
+            # Raise if the caller treats duplicates as errors
+            if on_conflict == 'error':
+                raise EntryExistsError(f"Entry '{data_dict['name']}' already exists in {table_name}")
 
-            # Add new data to database
-            session.add(new_entry)
-            print("Data added successfully!")
+            return 'exists'
 
-            # Commit the transaction to ensure the new entry gets an ID
-            session.commit()
+        # If no data in the database
+        else:
 
-            # Get the last inserted ID
-            last_id = session.query(main_table_class.id).order_by(main_table_class.id.desc()).first()[0]
+            # Get the inserted ID
+            last_id = result.inserted_primary_key[0]
 
             # If there is a last_id (there definitly should be)
             if last_id:
 
-                # Add entry to tags table with the last inserted ID
-                # Get tags from entry data
-                tags = data_dict['tags'].split(",")
+                # Add the thumbnail to the new entry
+                if store_thumbnail and data_dict['image_data']:
+                    session.execute(update(main_table_class.__table__).where(main_table_class.id == last_id)
+                        .values(thumb_data=create_thumbnail(data_dict['image_data'])))
 
-                # Iterate through tags
-                for tag in tags:
-
-                    # Insert tag entry into tag table
-                    tag_entry = tag_table(entry_name=data_dict['name'], entry_location=f'{table_name}/{last_id}')
+                # Add entry to tags table with the last inserted ID
+                # The tags table holds one row per entry and location, the tag values stay on the entry
+                tag_row = (data_dict['name'], f'{table_name}/{last_id}', table_name, last_id)
 
-                    # Add tag entry to database
-                    session.add(tag_entry)
+                # Insert the tag row through the DBAPI cursor inside the session's transaction
+                cursor = session.connection().connection.cursor()
+                try:
+                    cursor.execute(INSERT_TAG_SQL, tag_row)
+                    inserted = cursor.rowcount
+                finally:
+                    cursor.close()
 
-                    print(f"Tag '{tag}' added to tags table with location: {last_id}")
+                print(f"{inserted} tag row(s) added to tags table with location: {last_id}")
 
-                # Commit the transaction
+                # Commit the entry and its tags together
                 session.commit()
+                clear_entry_caches()
+                print("Data added successfully!")
+
+                return 'added'
 
             else:
                 print("Error retrieving last inserted ID.")
 
+                # Discard the inserted entry
+                session.rollback()
+
+    # Let duplicate errors requested by the caller through
+    except EntryExistsError:
+        raise
+
     # Catch any errors
     except Exception as e:
 
@@ -385,6 +807,8 @@ def add_data_to_table(session, table_name, data_dict, database_url):
         # Rollback the transaction in case of an error
         session.rollback()
 
+    return None
+
 def remove_entry(session, table_name, entry_name, database_url):
     """
     Removes an entry from the specified table.
@@ -403,25 +827,33 @@ def remove_entry(session, table_name, entry_name, database_url):
     try:
 
         # Create instance of WorldBuilder
-        world_builder = WorldBuilder(database_url)
+        world_builder = get_world_builder(database_url)
 
         # Get table class
         main_table_class = world_builder.get_table_class(table_name)
 
-        # Query the entry to be deleted
-        entry_to_delete = session.query(main_table_class).filter_by(name=entry_name).first()
+        # Get tag table
+        tag_table = world_builder.get_table_class('tags')
 
-        # Check for entry data
-        if entry_to_delete:
+        # Delete the entry without loading it
+        result = session.execute(delete(main_table_class).where(main_table_class.name == entry_name))
 
-            # Delete the entry
-            session.delete(entry_to_delete)
+        # Check for deleted entry
+        if result.rowcount:
+
+            # Delete the entry's tag rows in the same transaction
+            session.execute(delete(tag_table).where(tag_table.entry_name == entry_name,
+                tag_table.entry_table == table_name))
 
             # Commit changes
             session.commit()
+            clear_entry_caches()
             print(f"Entry '{entry_name}' removed successfully!")
 
         else:
+
+            # End the transaction opened by the delete attempt
+            session.rollback()
             print(f"Entry '{entry_name}' not found.")
 
     # Catch errors
@@ -438,6 +870,8 @@ def get_entry_names(session, table_name, database_url):
     """
     Retrieves the names of entries in the specified table.
 
+    Entry names are cached per database until the next write to an entry.
+
     Args:
         session: The session object.
         table_name (str): The name of the table.
@@ -450,23 +884,14 @@ def get_entry_names(session, table_name, database_url):
     # Try block to catch errors
     try:
 
-        # Get the table class dynamically using the session
-        world_builder = WorldBuilder(database_url)
+        # Get the cached names of all tables
+        names = _cached_all_entry_names(session.get_bind())
 
-        # Get main table class
-        table_class = world_builder.get_table_class(table_name)
-
-        # If the table class is found
-        if table_class:
-
-            # Query the table fo all entry names
-            result = session.query(table_class.name).all()
-
-            # Extract the names from the result
-            names = [row[0] for row in result]
+        # If the table is found
+        if table_name in names:
 
             # Return list of names
-            return names
+            return list(names[table_name])
 
         else:
             print(f"Error: Table class not found for {table_name}")
@@ -478,6 +903,34 @@ def get_entry_names(session, table_name, database_url):
         print(f"Error retrieving names from {table_name}: {e}")
         return []
 
+def get_all_entry_names(session, database_url):
+    """
+    Retrieves the names of the entries in every table.
+
+    The names of all tables are read with a single query and cached per database until the
+    next write to an entry.
+
+    Args:
+        session: The session object.
+        database_url (str): The URL of the database.
+
+    Returns:
+        dict: A dictionary mapping each table name to a list of its entry names.
+    """
+
+    # Try block to catch errors
+    try:
+
+        # Copy the cached names so callers can't change the cache
+        return {table_name: list(entries)
+            for table_name, entries in _cached_all_entry_names(session.get_bind()).items()}
+
+    # Catch errors
+    except Exception as e:
+
+        print(f"Error retrieving entry names: {e}")
+        return {}
+
 def get_data_for_entry(session, entry_name, database_url):
     """
     Retrieves data for a specific entry from the database.
@@ -491,11 +944,31 @@ def get_data_for_entry(session, entry_name, database_url):
         dict or None: A dictionary containing the data for the entry, or None if no data is found.
     """
 
+    # Only the data is needed
+    return get_entry_with_location(session, entry_name, database_url)[0]
+
+def get_entry_with_location(session, entry_name, database_url):
+    """
+    Retrieves the data for a specific entry together with the table it is stored in.
+
+    The table is read from the entry's tag row, which is needed to find the entry anyway, so this costs
+    no more than get_data_for_entry and saves a separate get_tag_location query.
+
+    Args:
+        session: The session object.
+        entry_name (str): The name of the entry.
+        database_url (str): The URL of the database.
+
+    Returns:
+        tuple: A dictionary containing the data for the entry and the name of its table, (None, None) if no data
+            is found.
+    """
+
     # Try block to catch errors
     try:
 
         # Create instance of WorldBuilder
-        world_builder = WorldBuilder(database_url)
+        world_builder = get_world_builder(database_url)
 
         # Get tag table
         tag_table = world_builder.get_table_class('tags')
@@ -506,30 +979,24 @@ def get_data_for_entry(session, entry_name, database_url):
         # Check for tag entry
         if not tag_entry:
             print("Entry Data not found.")
-            return
-
-        # Unpack entry location and id from entry_location column
-        entry_location, entry_id = tag_entry.entry_location.split('/')
+            return None, None
 
         # Get the entry table
-        table_class = world_builder.get_table_class(entry_location)
+        table_class = world_builder.get_table_class(tag_entry.entry_table)
 
-        # Query the database to get all columns for the specified entry_name
-        result = session.query(table_class).filter_by(id=entry_id).first()
+        # Load the entry by primary key
+        result = session.get(table_class, tag_entry.entry_id)
 
         # Check for result
         if result:
 
-            # Convert the result to a dictionary for easy access
-            data_dict = result.__dict__
-
-            # Remove unnecessary attributes
-            data_dict.pop("_sa_instance_state", None)
+            # Copy the mapped column values into a dictionary for easy access
+            data_dict = {column.key: getattr(result, column.key) for column in inspect(table_class).column_attrs}
 
-            return data_dict
+            return data_dict, tag_entry.entry_table
 
         else:
-            return None
+            return None, None
 
     # Catch Errors
     except Exception as e:
@@ -538,12 +1005,14 @@ def get_data_for_entry(session, entry_name, database_url):
         traceback.print_exc()
         print(f"Error retrieving data from {entry_name}: {e}")
 
-        return None
+        return None, None
 
 def get_all_tags(session, database_url):
     """
     Retrieves all tags from the database.
 
+    Tags are cached per database until the next write to an entry.
+
     Args:
         session: The session object.
         database_url (str): The URL of the database.
@@ -555,19 +1024,8 @@ def get_all_tags(session, database_url):
     # Try block to catch errors
     try:
 
-        # Create instance of WorldBuilder
-        world_builder = WorldBuilder(database_url)
-
-        # Get tag table
-        tag_table = world_builder.get_table_class('tags')
-
-        # Query to retrieve all tags
-        result = session.query(tag_table.entry_name).all()
-
-        # Extract the tags from the result
-        tags = [row[0] for row in result]
-
-        return tags
+        # Return the cached tags of the database
+        return list(_cached_all_tags(session.get_bind()))
 
     # Catch errors
     except Exception as e:
@@ -591,7 +1049,7 @@ def get_tag_location(session, entry_name, database_url):
     try:
 
         # Create instance of WorldBuilder
-        world_builder = WorldBuilder(database_url)
+        world_builder = get_world_builder(database_url)
 
         # Get tag table
         tag_table = world_builder.get_table_class('tags')
@@ -599,8 +1057,8 @@ def get_tag_location(session, entry_name, database_url):
         # Query to retrieve all tags for entry
         tag_entry = session.query(tag_table).filter_by(entry_name=entry_name).first()
 
-        # Split tag entry and return first index
-        tag_column = tag_entry.entry_location.split('/')[0]
+        # Get the table the entry lives in
+        tag_column = tag_entry.entry_table
 
         # Return tag location
         return tag_column
@@ -626,21 +1084,33 @@ def add_world_map(session, image_data, database_url):
     # Try block to catch errors
     try:
 
-        # Create instance of WorldBuilder
-        world = WorldBuilder(database_url)
+        # Get the raw SQLite connection of the session's transaction
+        raw_connection = session.connection().connection.driver_connection
 
-        #Get column_class
-        main_column_class = world.get_table_class('world')
+        # Incremental blob I/O needs Python 3.11+, otherwise write the map in one statement
+        if not hasattr(raw_connection, 'blobopen'):
+            session.execute(text("UPDATE world SET world_map = :data"), {'data': image_data})
 
-        #Get Entry
-        entry = session.query(main_column_class).first()
+        else:
 
-        #Update Entry
-        entry.world_map = image_data
+            # Reserve a zero filled blob of the final size
+            session.execute(text("UPDATE world SET world_map = zeroblob(:size)"), {'size': len(image_data)})
+
+            # Get the rowid of the world entry
+            row_id = session.execute(text("SELECT rowid FROM world LIMIT 1")).scalar()
+
+            # Write the map into the blob in chunks
+            with raw_connection.blobopen('world', 'world_map', row_id) as blob:
+                image_view = memoryview(image_data)
+                for offset in range(0, len(image_view), BLOB_CHUNK_SIZE):
+                    blob.write(image_view[offset:offset + BLOB_CHUNK_SIZE])
 
         #Commit changes
         session.commit()
 
+        # The map was written outside the ORM, drop loaded objects so they are re-read
+        session.expire_all()
+
     except Exception as e:
         # Print the traceback and error message
         traceback.print_exc()
@@ -665,16 +1135,13 @@ def veiw_world_map(session, database_url):
     # Try block to catch errors
     try:
         # Create instance of WorldBuilder
-        world = WorldBuilder(database_url)
+        world = get_world_builder(database_url)
 
         # Get column class
         main_table_class = world.get_table_class('world')
 
-        # Get Entry
-        entry = session.query(main_table_class).first()
-
-        # Get Data
-        data = entry.world_map
+        # Get only the map column, without loading the world entry
+        data = session.scalars(select(main_table_class.world_map).limit(1)).first()
 
         return data
 
@@ -684,6 +1151,33 @@ def veiw_world_map(session, database_url):
 
         print(f"Error viewing world map: {e}")
 
+def has_world_map(session, database_url):
+    """
+    Checks whether a world map image is stored in the database without reading it.
+
+    Args:
+        session: The session object.
+        database_url (str): The URL of the database.
+
+    Returns:
+        bool: True if a world map is stored.
+    """
+
+    # Try block to catch errors
+    try:
+        # Get column class
+        main_table_class = get_world_builder(database_url).get_table_class('world')
+
+        # Query the size of the map instead of the map itself
+        size = session.scalars(select(func.length(main_table_class.world_map)).limit(1)).first()
+
+        return bool(size)
+
+    except Exception as e:
+        print(f"Error checking world map: {e}")
+
+        return False
+
 def filter_tag_list_by_table(session, database_url, tag_list, table_name):
     """
     Filters a list of tags based on the specified table.
@@ -699,20 +1193,21 @@ def filter_tag_list_by_table(session, database_url, tag_list, table_name):
     """
 
     # Create world builder
-    world_builder = WorldBuilder(database_url)
+    world_builder = get_world_builder(database_url)
 
     # Create tag table
     tag_table = world_builder.get_table_class('tags')
 
-    # Query tag table to return tags from entry
-    all_tags = session.query(tag_table).filter(tag_table.entry_name.in_(tag_list)).all()
+    # Query tag table to return tags from entry, once per entry even though it has a row per tag
+    all_tags = session.query(tag_table.entry_name, tag_table.entry_table).filter(
+        tag_table.entry_name.in_(tag_list)).distinct().all()
 
     # Check to return all tags
     if table_name == 'all_categories':
         return [x.entry_name for x in all_tags]
 
     # Filter tags
-    filtered_tags = [x.entry_name for x in all_tags if x.entry_location.split('/')[0] == table_name]
+    filtered_tags = [x.entry_name for x in all_tags if x.entry_table == table_name]
 
     # Return list of filtered tags
     return filtered_tags
@@ -1,38 +1,91 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, BLOB
+from sqlalchemy import create_engine, event, text, Column, Index, Integer, String, Text, BLOB
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy import inspect
 
 
 Base = declarative_base()
 
+# Pragmas applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Version of the schema, stored in PRAGMA user_version once a database has been upgraded to it
+SCHEMA_VERSION = 1
+
+
+def create_database_engine(database_url):
+    """
+    Creates an engine for the database url with a persistent connection pool.
+
+    SQLite connections are configured with WAL journaling and a larger page cache
+    as soon as they are opened.
+
+    Args:
+        database_url (str): The URL of the database.
+
+    Returns:
+        Engine: The SQLAlchemy engine.
+    """
+
+    # Non SQLite databases use the SQLAlchemy defaults
+    if not database_url.startswith("sqlite"):
+        return create_engine(database_url, echo=False)
+
+    # Keep connections open between calls so the page cache stays warm
+    engine = create_engine(database_url, echo=False, poolclass=QueuePool,
+        connect_args={"check_same_thread": False})
+
+    # Apply the pragmas whenever the pool opens a new connection
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
 class WorldBuilder:
+
+    # Database urls whose tables have already been created in this process
+    _created = set()
+
     def __init__(self, database_url=None):
-        self.engine = create_engine(database_url, echo=False)
-        Base.metadata.create_all(bind=self.engine)
-
-    # Mapping of table names to their corresponding class objects
-        self.table_classes = {
-            'tags': WorldBuilder.Tag,
-            'world': WorldBuilder.World,
-            'planes_of_existence': WorldBuilder.Planes_of_Existence,
-            'continents': WorldBuilder.Continents,
-            'regions': WorldBuilder.Regions,
-            'countries': WorldBuilder.Countries,
-            'cities': WorldBuilder.Cities,
-            'historical_events': WorldBuilder.Historical_Events,
-            'religions': WorldBuilder.Religions,
-            'characters': WorldBuilder.Characters,
-            'deities': WorldBuilder.Deites,
-            'enemies': WorldBuilder.Enemies,
-            'items': WorldBuilder.Items,
-            'quests': WorldBuilder.Quests,
-        }
+        self.engine = create_database_engine(database_url)
+
+        # Session factory for the engine, objects stay loaded after commit to avoid refresh queries
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+        # Only create the tables once per database per process
+        if database_url not in WorldBuilder._created:
+
+            # An up to date database only costs the version query
+            if self.get_schema_version() < SCHEMA_VERSION:
+
+                # Skip the per-table CREATE checks when every table already exists
+                if not set(Base.metadata.tables).issubset(inspect(self.engine).get_table_names()):
+                    Base.metadata.create_all(bind=self.engine)
+
+                self.upgrade_schema()
+
+            WorldBuilder._created.add(database_url)
 
     class Tag(Base):
         __tablename__ = 'tags'
         id = Column(Integer, primary_key=True)
-        entry_name = Column(String, nullable=False)
+        entry_name = Column(String, nullable=False, index=True)
         entry_location = Column(String, nullable=False)
+        entry_table = Column(String, nullable=True, index=True)
+        entry_id = Column(Integer, nullable=True, index=True)
+        __table_args__ = (
+            Index('ix_tags_entry_name_location', 'entry_name', 'entry_location', unique=True),
+        )
 
     class World(Base):
         __tablename__ = 'world'
@@ -42,107 +95,230 @@ class WorldBuilder:
     class Planes_of_Existence(Base):
         __tablename__ = 'planes_of_existence'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Continents(Base):
         __tablename__ = 'continents'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Regions(Base):
         __tablename__ = 'regions'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Countries(Base):
         __tablename__ = 'countries'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Cities(Base):
         __tablename__ = 'cities'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Historical_Events(Base):
         __tablename__ = 'historical_events'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Religions(Base):
         __tablename__ = 'religions'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Characters(Base):
         __tablename__ = 'characters'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         stats = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Deites(Base):
         __tablename__ = 'deities'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         stats = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Enemies(Base):
         __tablename__ = 'enemies'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         stats = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
     class Items(Base):
         __tablename__ = 'items'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
         image_data = Column(BLOB, nullable=True)
+        thumb_data = Column(BLOB, nullable=True)
 
 
     class Quests(Base):
         __tablename__ = 'quests'
         id = Column(Integer, primary_key=True)
-        name = Column(String, nullable=False)
+        name = Column(String, nullable=False, index=True, unique=True)
         description = Column(Text, nullable=True)
         tags = Column(Text, nullable=True)
 
-    def get_table_class(self, table_name):
+    # Mapping of table names to their corresponding class objects, built once with the class
+    table_classes = {
+        'tags': Tag,
+        'world': World,
+        'planes_of_existence': Planes_of_Existence,
+        'continents': Continents,
+        'regions': Regions,
+        'countries': Countries,
+        'cities': Cities,
+        'historical_events': Historical_Events,
+        'religions': Religions,
+        'characters': Characters,
+        'deities': Deites,
+        'enemies': Enemies,
+        'items': Items,
+        'quests': Quests,
+    }
+
+    def get_schema_version(self):
+        """
+        Returns the schema version stored in the database, 0 for databases that were never upgraded.
+        """
+
+        # Only SQLite stores the version, other databases are always checked
+        if self.engine.dialect.name != 'sqlite':
+            return 0
+
+        with self.engine.connect() as connection:
+            return connection.execute(text("PRAGMA user_version")).scalar()
+
+    def upgrade_schema(self):
+        """
+        Adds any columns and indexes missing from databases created before they were defined.
+        """
+
+        with self.engine.begin() as connection:
+            inspector = inspect(connection)
+
+            for table in Base.metadata.sorted_tables:
+                columns = {column['name'] for column in inspector.get_columns(table.name)}
+
+                # Add missing columns
+                for column in table.columns:
+                    if column.name in columns:
+                        continue
+
+                    column_type = column.type.compile(dialect=connection.dialect)
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+                # Split the legacy "table/id" tag location into its own columns
+                if table.name == 'tags' and 'entry_table' not in columns:
+                    connection.execute(text(
+                        "UPDATE tags SET "
+                        "entry_table = substr(entry_location, 1, instr(entry_location, '/') - 1), "
+                        "entry_id = CAST(substr(entry_location, instr(entry_location, '/') + 1) AS INTEGER)"))
+
+                existing = {index['name']: bool(index['unique']) for index in inspector.get_indexes(table.name)}
+
+                for index in table.indexes:
+                    if existing.get(index.name) == bool(index.unique):
+                        continue
+
+                    # Older databases stored one duplicate tag row per tag, collapse them first
+                    if index.unique and table.name == 'tags':
+                        connection.execute(text(
+                            "DELETE FROM tags WHERE id NOT IN "
+                            "(SELECT MIN(id) FROM tags GROUP BY entry_name, entry_location)"))
+
+                    # Entries used to allow repeated names, rename all but the first so the unique name index fits
+                    if index.unique and [column.name for column in index.columns] == ['name']:
+                        self.rename_duplicate_names(connection, table.name)
+
+                    # Any other duplicate values would block the unique index that inserts rely on
+                    if index.unique:
+                        index_columns = ', '.join(column.name for column in index.columns)
+                        duplicate = connection.execute(text(
+                            f"SELECT 1 FROM {table.name} GROUP BY {index_columns} HAVING COUNT(*) > 1 LIMIT 1")).first()
+
+                        if duplicate:
+                            raise RuntimeError(f"Could not create index {index.name}: duplicate values in {table.name}")
+
+                    # Replace indexes whose uniqueness has changed
+                    if index.name in existing:
+                        connection.execute(text(f"DROP INDEX {index.name}"))
+
+                    index.create(bind=connection)
+
+            # Mark the database as up to date
+            if connection.dialect.name == 'sqlite':
+                connection.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+
+    @staticmethod
+    def rename_duplicate_names(connection, table_name):
+        """
+        Renames entries that share a name with an older entry to "name (id)", along with their tag rows.
+
+        Args:
+            connection: The connection of the upgrade transaction.
+            table_name (str): The name of the entry table.
+        """
+
+        # Entries whose name was already taken by an entry with a lower id
+        duplicates = f"SELECT id FROM {table_name} WHERE id NOT IN (SELECT MIN(id) FROM {table_name} GROUP BY name)"
+
+        # Point the tag rows of those entries at the new name first, they are found through the old one
+        connection.execute(text(
+            f"UPDATE tags SET entry_name = entry_name || ' (' || "
+            f"substr(entry_location, instr(entry_location, '/') + 1) || ')' "
+            f"WHERE entry_location IN (SELECT '{table_name}/' || id FROM ({duplicates}))"))
+
+        connection.execute(text(f"UPDATE {table_name} SET name = name || ' (' || id || ')' WHERE id IN ({duplicates})"))
+
+    @classmethod
+    def get_table_class(cls, table_name):
 
         # Returns the class object for a given table name.
-        return self.table_classes.get(table_name)
+        return cls.table_classes.get(table_name)
 
     def get_session(self):
-        Session = sessionmaker(bind=self.engine)
-        return Session()
\ No newline at end of file
+        return self.session_factory()
\ No newline at end of file
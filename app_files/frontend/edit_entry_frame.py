@@ -2,11 +2,12 @@
 This class defines the EditEntryFrame frame.
 """
 
-import io
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from .. import backend_logic
+from ..other_classes.thumbnail_cache import ThumbnailCache
+from ..other_classes.universal_handler import UniversalHandler
 from .view_entry_frame import ViewEntryFrame
 
 
@@ -32,8 +33,8 @@ class EditEntryFrame(ttk.Frame):
             controller (tk.Tk): The main application controller.
             app_data: An object containing application data.
 
-        This method sets up the user interface for editing or adding new entries, including text fields, canvas for
-        scrolling, image display, tag selection, and buttons for saving or deleting entries.
+        This method sets up the name field and the save and back buttons, then schedules build_form to add the text
+        fields, canvas for scrolling, image display, tag selection, and delete button once the frame is shown.
         """
 
         # Create frame and save args as properties of frame
@@ -43,14 +44,28 @@ class EditEntryFrame(ttk.Frame):
         self.app_data = app_data
         self.text_widgets = {}
         self.image_data = None
+        self.original_photo = None
+        self.displayed_image_data = None
+        self.tag_window = None
+
+        # The ViewEntryFrame of each category built in the tag window
+        self.tag_frames = {}
+
+        # Pending idle callbacks of the resize handlers
+        self.scrollregion_after = None
+        self.canvas_width_after = None
+        self.canvas_width = 0
+
+        # Tags of the entry, a dict keeps them unique in the order they were added
+        self.tags = {}
+
+        # The filtered tags of each filter option already chosen, cleared when a tag is added
+        self.filter_cache = {}
 
         # If no selected_world end method
         if not self.app_data.selected_world:
             return
 
-        # Retrieve column names using the backend logic
-        self.column_names = backend_logic.get_column_names(self.app_data.session, self.app_data.selected_category)
-
         # Top label
         top_label = ttk.Label(self, text=f"New {self.app_data.selected_category.title()} Entry:")
         top_label.pack(pady=5)
@@ -63,6 +78,41 @@ class EditEntryFrame(ttk.Frame):
         self.name_text = ttk.Entry(self)
         self.name_text.pack(pady=5)
 
+        button_frame = ttk.Frame(self)
+        button_frame.pack(side='bottom', pady=10)
+
+        # Save button, enabled once the form is built
+        self.save_button = ttk.Button(button_frame, text='Save', command=self.save, state=tk.DISABLED)
+        self.save_button.pack(side=tk.RIGHT, padx=10)
+
+        back_button = ttk.Button(button_frame, text='Back', command=self.go_back)
+        back_button.pack(side=tk.LEFT, padx=10)
+
+        # Placeholder shown until the form is built
+        self.loading_label = ttk.Label(self, text="Loading...")
+        self.loading_label.pack(pady=5)
+
+        # Build the rest of the form once the frame has been drawn
+        self.after_idle(self.build_form)
+
+    def build_form(self):
+        """
+        Builds the scrollable form with a field per column, the image and the tag widgets.
+
+        Called from the event loop after the frame is first drawn, so the frame shows up before the form is built.
+        """
+
+        # The frame was replaced before it was drawn
+        if not self.winfo_exists():
+            return
+
+        # Remove the placeholder
+        self.loading_label.destroy()
+
+        # Retrieve the columns edited as text using the backend logic
+        self.editable_columns = backend_logic.get_editable_columns(self.app_data.session,
+            self.app_data.selected_category)
+
         # Canvas frame
         canvas_frame = ttk.Frame(self)
         canvas_frame.pack(pady=5, fill='both', expand=True)
@@ -78,28 +128,11 @@ class EditEntryFrame(ttk.Frame):
         # Configure canvas to y-scroll
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
-        # Create inner_frame and place it on the canvas
+        # Create inner_frame
         self.inner_frame = ttk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.inner_frame, anchor='nw')
-
-        # Store the creation of the window as a variable for later calls
-        self.inner_frame_id = self.canvas.create_window(0, 0, window=self.inner_frame, anchor='nw')
-
-        # Bind the creatino of the inner_frame to on_frame_configure
-        self.inner_frame.bind("<Configure>", self.on_frame_configure)
-
-        # Bind the creation of the canvas to on_canvas_creation
-        self.canvas.bind("<Configure>", self.on_canvas_configure)
-
-        # Finally, configure the scrollbar to the canvas
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Iterate through column_names
-        for column_name in self.column_names:
 
-            # if column name in list, skip iteration
-            if column_name in ["tags", "name", "image_data"]:
-                continue
+        # Iterate through the columns edited as text
+        for column_name in self.editable_columns:
 
             # Column name label
             label = ttk.Label(self.inner_frame, text=column_name.title())
@@ -139,22 +172,14 @@ class EditEntryFrame(ttk.Frame):
         tag_label = ttk.Label(self.inner_frame, text='Tags')
         tag_label.pack(pady=5)
 
-        # Retrieve all tags from tag table
-        tags = backend_logic.get_all_tags(self.app_data.session, self.app_data.url)
-
-        # if we are editing an existing entry
-        if self.app_data.selected_entry_data:
-
-            # If name in tags
-            if self.app_data.selected_entry_data['name'] in tags:
-
-                # Remove name in tags
-                tags.remove(self.app_data.selected_entry_data['name'])
-
-        # Combobox for tags
-        self.tag_combobox = ttk.Combobox(self.inner_frame, values=tags, state='readonly')
+        # Combobox for tags, filled once the tags are retrieved
+        self.tag_combobox = ttk.Combobox(self.inner_frame, state='readonly')
         self.tag_combobox.pack(pady=5)
 
+        # Retrieve all tags from tag table in the background
+        self.app_data.db_worker.submit(self, self.set_tag_options, backend_logic.get_all_tags,
+            self.app_data.url, self.app_data.url)
+
         # Add Frame to pack the tag_listbox and filter combo
         tag_frame = ttk.Frame(self.inner_frame)
         tag_frame.pack(pady=10)
@@ -163,10 +188,7 @@ class EditEntryFrame(ttk.Frame):
         self.tag_listbox = tk.Listbox(tag_frame, selectmode=tk.MULTIPLE)
         self.tag_listbox.pack(side='left', padx=5)
 
-        filter_options = [x.replace('_', ' ').title() for x in self.app_data.table_names if x != 'tags']
-        filter_options = ['All Categories'] + filter_options
-
-        self.tag_filter_combobox = ttk.Combobox(tag_frame, values=filter_options, state='readonly')
+        self.tag_filter_combobox = ttk.Combobox(tag_frame, values=self.app_data.filter_options, state='readonly')
         self.tag_filter_combobox.pack(side='right', padx=5)
         self.tag_filter_combobox.bind("<<ComboboxSelected>>", self.update_tag_listbox)
 
@@ -179,17 +201,42 @@ class EditEntryFrame(ttk.Frame):
         delete_entry_button = ttk.Button(self.inner_frame, text="Delete Entry", command=self.delete_entry)
         delete_entry_button.pack(pady=5)
 
-        button_frame = ttk.Frame(self)
-        button_frame.pack(side='bottom', pady=10)
+        # Place the inner_frame on the canvas once all of its children exist, storing the window id for later calls
+        self.inner_frame_id = self.canvas.create_window(0, 0, window=self.inner_frame, anchor='nw')
 
-        save_button = ttk.Button(button_frame, text='Save', command=self.save)
-        save_button.pack(side=tk.RIGHT, padx=10)
+        # Bind the creatino of the inner_frame to on_frame_configure
+        self.inner_frame.bind("<Configure>", self.on_frame_configure)
 
-        back_button = ttk.Button(button_frame, text='Back', command=self.go_back)
-        back_button.pack(side=tk.LEFT, padx=10)
+        # Bind the creation of the canvas to on_canvas_creation
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
 
         self.insert_data_if_exists()
 
+        # The form is complete, allow saving
+        self.save_button.config(state=tk.NORMAL)
+
+    def set_tag_options(self, tags):
+        """
+        Fills the tag combobox with the retrieved tags.
+
+        Args:
+            tags (list): All tags in the tag table.
+
+        The entry's own name is left out so an entry cannot be tagged with itself.
+        """
+
+        # if we are editing an existing entry
+        if self.app_data.selected_entry_data:
+
+            # If name in tags
+            if self.app_data.selected_entry_data['name'] in tags:
+
+                # Remove name in tags
+                tags.remove(self.app_data.selected_entry_data['name'])
+
+        # Set the combobox options
+        self.tag_combobox.configure(values=tags)
+
     def go_back(self):
         """
         Returns to the previous frame (WorldOverviewFrame).
@@ -212,27 +259,15 @@ class EditEntryFrame(ttk.Frame):
         saving, it navigates back to the WorldOverviewFrame.
         """
 
-        # Instantiate an empty dictionary to generate the data to save
-        data_to_write = {}
+        # Build the dictionary from the stripped text of every column
+        data_to_write = {column_name: self.text_widgets[column_name].get("1.0", "end-1c").strip()
+            for column_name in self.editable_columns}
 
         # Insert name in dictionary
         data_to_write['name'] = self.name_text.get()
 
-        # Iterate through column_names
-        for column_name in self.column_names:
-
-            # Skip iteration if column name in list
-            if column_name in ['tags', 'name', 'image_data']:
-                continue
-
-            # Save data from named text widget and save in dictionary
-            data_to_write[column_name] = self.text_widgets[column_name].get("1.0", tk.END).strip()
-
-        # Get selected tags from the Listbox
-        selected_tags = self.tag_listbox.get(0, tk.END)
-
-        # Convert the list of tags to a comma-separated string
-        data_to_write['tags'] = ', '.join(selected_tags)
+        # Convert the tags to a comma-separated string, including those hidden by the tag filter
+        data_to_write['tags'] = ', '.join(self.tags)
 
         # Check for image_data
         if self.image_data:
@@ -240,10 +275,33 @@ class EditEntryFrame(ttk.Frame):
             # Include the image data in the data_to_write dictionary
             data_to_write['image_data'] = self.image_data
 
-        # Save dictionary in database using backend logic
-        backend_logic.add_data_to_table(self.app_data.session,
+        # Disable saving until the entry is written
+        self.save_button.config(state=tk.DISABLED)
+
+        # Save dictionary in database in the background using backend logic
+        self.app_data.db_worker.submit(self, lambda result: self.finish_save(result, data_to_write),
+            backend_logic.add_data_to_table, self.app_data.url,
             self.app_data.selected_category, data_to_write, self.app_data.url)
 
+    def finish_save(self, result, data_to_write):
+        """
+        Finishes saving the entry once it is written, asking to update an entry that already exists.
+
+        Args:
+            result (str): The result of backend_logic.add_data_to_table.
+            data_to_write (dict): The data of the entry.
+        """
+
+        # If the entry already exists, ask the user if they want to update the data
+        if result == 'exists' and messagebox.askyesno("Update Entry",
+                "Entry already exists. Do you want to update the data?"):
+
+            # Save again in the background, overwriting the existing entry, then finish
+            self.app_data.db_worker.submit(self, lambda result: self.finish_save(result, data_to_write),
+                backend_logic.add_data_to_table, self.app_data.url,
+                self.app_data.selected_category, data_to_write, self.app_data.url, 'update')
+            return
+
         # Show WorldOverviewFrame
         self.controller.choose_next_frame("WorldOverviewFrame")
 
@@ -279,14 +337,15 @@ class EditEntryFrame(ttk.Frame):
         # Check for previous entry data
         if not self.app_data.previous_entry_data:
 
-            # Set selected entry data to previous entry data
+            # Set selected entry data and category to previous entry data and category
             self.app_data.previous_entry_data = self.app_data.selected_entry_data
+            self.app_data.previous_category = self.app_data.selected_category
 
         # Iterate through text_boxes in self.text_widgets, unpacking them into table and textbox
         for table, textbox in self.text_widgets.items():
 
-            # Insert data into textbox
-            textbox.insert(tk.END, self.app_data.selected_entry_data[table])
+            # Insert data at the start of the empty textbox
+            textbox.insert('1.0', self.app_data.selected_entry_data[table])
 
         # Insert name into name_text
         self.name_text.insert(tk.END, self.app_data.selected_entry_data['name'])
@@ -297,8 +356,8 @@ class EditEntryFrame(ttk.Frame):
             # Store image data as an attribute of the class to avoid garbage collection
             self.image_data = self.app_data.selected_entry_data['image_data']
 
-            # Display image using method
-            self.display_image(self.image_data)
+            # Display the stored thumbnail, entries saved before thumbnails existed fall back to the full image
+            self.display_image(self.app_data.selected_entry_data.get('thumb_data') or self.image_data)
 
         # Clear the Listbox
         self.tag_listbox.delete(0, tk.END)
@@ -306,15 +365,15 @@ class EditEntryFrame(ttk.Frame):
         # Get list of tags
         existing_tags = self.app_data.selected_entry_data['tags'].split(', ')
 
-        # Iterate through existing tags
-        for tag in existing_tags:
+        # Skip the entry's own name
+        tags_to_show = [tag for tag in existing_tags if tag != self.app_data.selected_entry_data['name']]
 
-            # Skip if tag is own name
-            if tag == self.app_data.selected_entry_data['name']:
-                continue
+        # Insert all tags into the listbox with a single call
+        if tags_to_show:
+            self.tag_listbox.insert(tk.END, *tags_to_show)
 
-            # Insert tag into listbox
-            self.tag_listbox.insert(tk.END, tag)
+        # Keep the tags for duplicate checks and saving
+        self.tags = dict.fromkeys(tag for tag in tags_to_show if tag)
 
     def add_tag(self, event):
         """
@@ -337,12 +396,17 @@ class EditEntryFrame(ttk.Frame):
 
             # Insert selected tag
             self.tag_listbox.insert(0, selected_tag)
+            if selected_tag:
+                self.tags[selected_tag] = None
+                self.filter_cache.clear()
 
-        # Else if selected_tag is not none and is not in tag_listbox
-        elif selected_tag and selected_tag not in self.tag_listbox.get(0, tk.END):
+        # Else if selected_tag is not none and is not already a tag
+        elif selected_tag and selected_tag not in self.tags:
 
             # Insert selected tag at the end of the list_box
             self.tag_listbox.insert(tk.END, selected_tag)
+            self.tags[selected_tag] = None
+            self.filter_cache.clear()
 
             # Clear the combobox after adding the tag
             self.tag_combobox.set("")
@@ -362,21 +426,52 @@ class EditEntryFrame(ttk.Frame):
         selected_index = self.tag_listbox.curselection()
         selected_tag = self.tag_listbox.get(self.tag_listbox.curselection())
 
-        # Retrieve information about the selected tag
-        self.app_data.selected_entry_data = backend_logic.get_data_for_entry(self.app_data.session,
-            selected_tag, self.app_data.url)
-        self.app_data.selected_category = backend_logic.get_tag_location(self.app_data.session,
-            selected_tag, self.app_data.url)
+        # Retrieve the data and category of the selected tag in the background, then show it
+        self.app_data.db_worker.submit(self, lambda result: self.open_tag_window(result, selected_index),
+            backend_logic.get_entry_with_location, self.app_data.url, selected_tag, self.app_data.url)
 
-        # Create a new Toplevel window
-        new_window = tk.Toplevel(self.parent)
-        new_window.geometry("700x600")
-        new_window.protocol("WM_DELETE_WINDOW", lambda: self.on_window_close(new_window))
+    def open_tag_window(self, result, selected_index):
+        """
+        Shows the retrieved tag entry in the tag window, creating the window if needed.
+
+        Args:
+            result (tuple): The data of the tag entry and the name of its table.
+            selected_index (tuple): The index of the tag in the tag listbox.
+        """
+
+        # Store the data and category of the selected tag
+        self.app_data.selected_entry_data, self.app_data.selected_category = result
+
+        # Reuse the open tag window
+        if self.tag_window and self.tag_window.winfo_exists():
+            new_window = self.tag_window
+
+        # Otherwise create a new Toplevel window and configure size and closing
+        else:
+            new_window = tk.Toplevel(self)
+            new_window.geometry("700x600")
+            new_window.protocol("WM_DELETE_WINDOW", lambda: self.on_window_close(new_window))
+            self.tag_window = new_window
+            self.tag_frames = {}
 
-        # Create a new instance of ViewEntryFrame with the info from the selected tag
-        new_frame = ViewEntryFrame(new_window, self.controller, self.app_data)
+            # Bind scroll events once per window, the binding goes away with the window
+            UniversalHandler.bind_scroll_event(new_window)
 
-        # Pack the EditEntryFrame into the new window
+        # Hide the frame of the entry shown before
+        for frame in self.tag_frames.values():
+            frame.pack_forget()
+
+        # Reuse the frame already built for the category, showing the selected entry in its widgets
+        new_frame = self.tag_frames.get(self.app_data.selected_category)
+        if new_frame:
+            new_frame.reload_entry()
+
+        # Otherwise create a new instance of ViewEntryFrame with the info from the selected tag
+        else:
+            new_frame = ViewEntryFrame(new_window, self.controller, self.app_data)
+            self.tag_frames[self.app_data.selected_category] = new_frame
+
+        # Pack the ViewEntryFrame into the tag window
         new_frame.pack(expand=True, fill="both", pady=20, padx=20)
 
         # Deselect the tag after opening the new window
@@ -384,32 +479,59 @@ class EditEntryFrame(ttk.Frame):
 
     def on_frame_configure(self, event):
         """
-        Configures the canvas frame.
+        Schedules an update of the canvas scroll region when the inner frame changes size.
 
         Args:
             event (tk.Event): The event object representing the configuration change event in the canvas.
 
-        This method adjusts the canvas frame to fit the canvas contents.
+        Resizing fires bursts of configure events, so the scroll region is only recomputed once they are handled.
+        """
+
+        # An update is already scheduled
+        if self.scrollregion_after:
+            return
+
+        self.scrollregion_after = self.after_idle(self.update_scrollregion)
+
+    def update_scrollregion(self):
+        """
+        Configures the scrollregion to be the canvas bbox.
         """
-        # Configure the scrollregion to be the canvas bbox
+
+        self.scrollregion_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def on_canvas_configure(self, event):
         """
-        Configures the canvas.
+        Schedules an update of the inner frame's width when the canvas changes size.
 
         Args:
             event (tk.Event): The event object representing the configuration change event in the canvas.
 
-        This method adjusts the canvas width in response to configuration changes.
+        Only the last width of a burst of configure events is applied.
+        """
+
+        # Keep the latest width, an update may already be scheduled
+        self.canvas_width = event.width
+        if self.canvas_width_after:
+            return
+
+        self.canvas_width_after = self.after_idle(self.update_inner_frame_width)
+
+    def update_inner_frame_width(self):
+        """
+        Adjusts the inner frame's width to the canvas width.
         """
-        self.canvas.itemconfig(self.inner_frame_id, width=event.width)
+
+        self.canvas_width_after = None
+        self.canvas.itemconfig(self.inner_frame_id, width=self.canvas_width)
 
     def select_image(self):
         """
         Opens a file dialog to select an image.
 
-        This method opens a file dialog to select an image file and displays the selected image.
+        This method opens a file dialog to select an image file. The file is read and resized on the database
+        worker and displayed by set_image.
         """
 
         # Open a file dialog to select an image file
@@ -418,12 +540,49 @@ class EditEntryFrame(ttk.Frame):
         # If there is a file_path
         if file_path:
 
-            # Read the image file and convert it to bytes
-            with open(file_path, 'rb') as file:
-                self.image_data = file.read()
+            # Read and resize the image in the background, then display it
+            self.app_data.db_worker.run(self, self.set_image, self.load_image, file_path, self.image_data)
+
+    @staticmethod
+    def load_image(file_path, current_image_data=None):
+        """
+        Reads an image file and creates its thumbnail, run on a worker thread.
+
+        Args:
+            file_path (str): The path of the image file.
+            current_image_data (bytes): The image already shown, if any.
+
+        Returns:
+            tuple or None: The raw image data and the thumbnail as a PIL image, None if the image is already shown.
+        """
+
+        # Read the image file and convert it to bytes
+        with open(file_path, 'rb') as file:
+            image_data = file.read()
 
-            # Display the selected image
-            self.display_image(self.image_data)
+        # Skip decoding when the same image is selected again
+        if image_data == current_image_data:
+            return None
+
+        return image_data, ThumbnailCache.create_image(image_data)
+
+    def set_image(self, loaded_image):
+        """
+        Stores and displays an image loaded by load_image.
+
+        Args:
+            loaded_image (tuple): The raw image data and its thumbnail, None if the image is already shown.
+        """
+
+        # The selected image is the one already shown
+        if loaded_image is None:
+            return
+
+        self.image_data, thumbnail = loaded_image
+        self.displayed_image_data = self.image_data
+
+        # Get the thumbnail as a PhotoImage, reusing the already resized image
+        self.show_photo(ThumbnailCache.get_photo(self.image_data, thumbnail))
 
     def display_image(self, image_data):
         """
@@ -432,18 +591,44 @@ class EditEntryFrame(ttk.Frame):
         Args:
             image_data (bytes): The raw image data.
 
-        This method displays the selected image within the EditEntryFrame.
+        This method displays the selected image within the EditEntryFrame, decoding it on the database worker
+        unless its thumbnail is cached.
+        """
+
+        # Remember the image requested last, a slower decode of an earlier image must not replace it
+        self.displayed_image_data = image_data
+
+        # Show a cached thumbnail right away
+        photo = ThumbnailCache.get_cached_photo(image_data)
+        if photo:
+            self.show_photo(photo)
+            return
+
+        # Otherwise decode and resize the image in the background, then show it
+        self.app_data.db_worker.run(self, lambda image: self.show_decoded_image(image_data, image),
+            ThumbnailCache.create_image, image_data)
+
+    def show_decoded_image(self, image_data, image):
         """
+        Shows a thumbnail decoded by the database worker, unless another image was requested since.
+
+        Args:
+            image_data (bytes): The raw image data the thumbnail was decoded from.
+            image (Image.Image): The thumbnail.
+        """
+
+        if image_data is not self.displayed_image_data:
+            return
 
-        # Open the image using PIL
-        image = Image.open(io.BytesIO(image_data))
+        self.show_photo(ThumbnailCache.get_photo(image_data, image))
 
-        # Resize the image if necessary to fit in the GUI
-        # Use Image.Resampling.LANCZOS for high-quality downsampling
-        image = image.resize((200, 200), Image.Resampling.LANCZOS)
+    def show_photo(self, photo):
+        """
+        Displays a thumbnail in the image label.
 
-        # Convert the image to Tkinter PhotoImage format
-        photo = ImageTk.PhotoImage(image)
+        Args:
+            photo (ImageTk.PhotoImage): The thumbnail.
+        """
 
         # Display the image in a label
         self.image.configure(image=photo)
@@ -462,25 +647,18 @@ class EditEntryFrame(ttk.Frame):
         """
 
         # Check if the image data exists
-        if hasattr(self, 'image_data'):
-
-            # Open the original image using PIL
-            original_image = Image.open(io.BytesIO(self.image_data))
-
-            # Create a new window to display the original image
-            original_window = tk.Toplevel(self.parent)
-            original_window.title("Original Image")
-
-            # Create a label to display the original image
-            original_image_label = ttk.Label(original_window)
+        if self.image_data:
 
-            # Convert the original image to Tkinter PhotoImage format
-            original_photo = ImageTk.PhotoImage(original_image)
+            # Reuse the original image if it was already decoded
+            if self.original_photo and self.original_photo[0] is self.image_data:
+                self.show_original_image(self.original_photo[1])
+                return
 
-            # Display the original image in the label
-            original_image_label.configure(image=original_photo)
-            original_image_label.image = original_photo  # Keep a reference to avoid garbage collection
-            original_image_label.pack()
+            # Decode the original image in the background, reduced to the screen size where possible
+            image_data = self.image_data
+            screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+            self.app_data.db_worker.run(self, lambda image: self.show_original_image(image, image_data),
+                ThumbnailCache.create_original, image_data, screen_size)
 
         # If no image_data
         else:
@@ -488,6 +666,33 @@ class EditEntryFrame(ttk.Frame):
             # If image data does not exist, show a message
             messagebox.showinfo("No Image", "No image data available.")
 
+    def show_original_image(self, image, image_data=None):
+        """
+        Shows the decoded original image in a new window.
+
+        Args:
+            image (Image.Image or ImageTk.PhotoImage): The decoded image, or its cached PhotoImage.
+            image_data (bytes): The raw data the image was decoded from, None if the PhotoImage was cached.
+        """
+
+        # Convert the original image to Tkinter PhotoImage format and keep it for the next time
+        if image_data is None:
+            original_photo = image
+        else:
+            original_photo = ImageTk.PhotoImage(image)
+            self.original_photo = (image_data, original_photo)
+
+        # Create a new window to display the original image
+        original_window = tk.Toplevel(self.parent)
+        original_window.title("Original Image")
+
+        # Display the original image in a label
+        original_image_label = ttk.Label(original_window, image=original_photo)
+        original_image_label.pack()
+
+        # Keep a reference to avoid garbage collection
+        original_image_label.image = original_photo
+
     def update_tag_listbox(self, event):
         """
         Updates the tag listbox based on the selected category.
@@ -499,24 +704,21 @@ class EditEntryFrame(ttk.Frame):
         """
 
         # Get selected filter option
-        selected_option = self.tag_filter_combobox.get().replace(' ', '_').lower()
-
-        # Get the entire tag list and strip the excess whitespace from rach item in the list
-        tag_list = self.app_data.selected_entry_data['tags'].split(',')
-        tag_list = [x.strip() for x in tag_list]
+        selected_option = self.app_data.display_to_raw.get(self.tag_filter_combobox.get(), 'all_categories')
 
-        # Get list of filtered tags using backend logic
-        filtered_tags = backend_logic.filter_tag_list_by_table(self.app_data.session,
-            self.app_data.url, tag_list, selected_option)
+        # Get list of filtered tags using backend logic, once per filter option until the tags change
+        filtered_tags = self.filter_cache.get(selected_option)
+        if filtered_tags is None:
+            filtered_tags = backend_logic.filter_tag_list_by_table(self.app_data.session,
+                self.app_data.url, list(self.tags), selected_option)
+            self.filter_cache[selected_option] = filtered_tags
 
         # Delete all entries in the listbox
         self.tag_listbox.delete(0, tk.END)
 
-        # Iterate through tags
-        for tag in filtered_tags:
-
-            # Insert tag into listbox
-            self.tag_listbox.insert(tk.END, tag)
+        # Insert the filtered tags with a single call
+        if filtered_tags:
+            self.tag_listbox.insert(tk.END, *filtered_tags)
 
     def on_window_close(self, window):
         """
@@ -525,25 +727,17 @@ class EditEntryFrame(ttk.Frame):
         Args:
             window (tk.Toplevel): The Toplevel window to be closed.
 
-        This method unbinds mouse wheel events from the canvas, destroys the provided window, and resets the application
+        This method destroys the provided window, which also removes its scroll bindings, and resets the application
         state to the previously selected entry data and category.
         """
 
         # Destroy the window
         window.destroy()
+        self.tag_window = None
+        self.tag_frames = {}
 
-        # Set previous entry data to selected entry data
+        # Retrieve the previous data as the selected data, the frame itself still shows it
         self.app_data.selected_entry_data = self.app_data.previous_entry_data
 
-        # Set None to previous entry data
-        self.app_data.previous_entry_data = None
-
-        # Reset the selected category
-        self.app_data.selected_category = backend_logic.get_tag_location(self.app_data.session,
-            self.app_data.selected_entry_data['name'], self.app_data.url)
-
-        # Instantiate new EditEntryFrame
-        new_frame = EditEntryFrame(self.parent, self.controller, self.app_data)
-
-        # Show new frame
-        self.controller.choose_next_frame("EditEntryFrame")
+        # Restore the category stored with the previous data, no lookup needed
+        self.app_data.selected_category = self.app_data.previous_category
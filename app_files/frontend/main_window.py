@@ -56,6 +56,9 @@ class MainWindow(tk.Tk):
         # Track the current frame
         self.current_frame = None
 
+        # Frames hidden instead of destroyed, keyed by class name, reused while they can show the current state
+        self.parked_frames = {}
+
         # Show frame WorldSelectionFrame
         self.choose_next_frame("WorldSelectionFrame")
 
@@ -90,17 +93,17 @@ class MainWindow(tk.Tk):
         Handles the closing event of the application window.
 
         This method prompts the user to confirm if they want to quit the application. If confirmed, it closes the
-        database session (if exists) and destroys the main application window.
+        database sessions (if any) and destroys the main application window.
         """
 
         # Run messagebox to ask for if the user wants to quit
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
 
-            # Check for session
-            if self.app_data.session:
+            # Close the session of every database opened
+            self.app_data.close_sessions()
 
-                # Close session
-                self.app_data.session.close()
+            # Stop the database worker threads
+            self.app_data.db_worker.shutdown()
 
             # Destroy main window
             self.destroy()
@@ -115,9 +118,11 @@ class MainWindow(tk.Tk):
         This method selects the appropriate frame from the self.frames dictionary based on the provided name,
         and then displays it on the main application window using the show_frame method.
         """
-        for frame in self.frames.items():
-            if next_frame_name == frame[0]:
-                self.show_frame(frame[1])
+
+        # Look up the frame class by name, unknown names are ignored
+        frame_class = self.frames.get(next_frame_name)
+        if frame_class:
+            self.show_frame(frame_class)
 
     def show_frame(self, cont):
         """
@@ -126,21 +131,23 @@ class MainWindow(tk.Tk):
         Args:
             cont: The class or instance of the frame to be displayed.
 
-        This method displays the specified frame in the main application window, hides the current frame (if exists),
-        updates the current frame, and adjusts the window size accordingly. Additionally, it sets specific dimensions
-        for frames of type EditEntryFrame or ViewEntryFrame.
+        This method displays the specified frame in the main application window, parks or destroys the current frame
+        (if exists) so its widgets don't accumulate over a session, and updates the current frame.
         """
 
-        # If a frame class is provided, create a new instance
-        frame = cont(self, self, self.app_data)
-
+        # If a frame class is provided, reuse its parked instance or create a new one
+        frame = self.get_frame(cont) if isinstance(cont, type) else cont
 
         # Save the class of the current frame
-        self.app_data.previous_frame = cont
+        self.app_data.previous_frame = type(frame)
 
-        # Hide the current frame
-        if self.current_frame:
-            self.current_frame.pack_forget()
+        # Hide the current frame if it can be reused, otherwise destroy it so its widgets don't accumulate
+        if self.current_frame and self.current_frame is not frame:
+            if hasattr(self.current_frame, "can_reuse"):
+                self.current_frame.pack_forget()
+                self.parked_frames[type(self.current_frame).__name__] = self.current_frame
+            else:
+                self.current_frame.destroy()
 
         # Place the frame inside the main window using pack with padding
         frame.pack(expand=True, fill="both", pady=20)
@@ -152,6 +159,31 @@ class MainWindow(tk.Tk):
         if hasattr(frame, "update_label_text"):
             frame.update_label_text()
 
+    def get_frame(self, frame_class):
+        """
+        Returns the parked instance of a frame class if it can still be used, or a new instance.
+
+        Args:
+            frame_class: The class of the frame to be displayed.
+
+        Frames that define can_reuse() are parked when hidden. A parked frame is refreshed and reused if it
+        can show the current app_data, and destroyed otherwise.
+        """
+
+        # Take the parked frame of the class, if any
+        frame = self.parked_frames.pop(frame_class.__name__, None)
+
+        # Reuse the parked frame, bringing its data up to date
+        if frame and frame.can_reuse():
+            frame.refresh()
+            return frame
+
+        # Destroy a parked frame built for other data
+        if frame:
+            frame.destroy()
+
+        return frame_class(self, self, self.app_data)
+
     def show_settings(self):
         """
         This function call the settings frams to be packed into the main app window
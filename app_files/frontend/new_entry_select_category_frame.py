@@ -44,9 +44,9 @@ class NewEntrySelectCategoryFrame(ttk.Frame):
         self.listbox = tk.Listbox(self, height=len(self.app_data.table_names))
         self.listbox.pack()
 
-        # Iterate through table names and add to listbox
-        for item in self.app_data.table_names:
-            self.listbox.insert(tk.END, item.replace('_', ' ').title())
+        # Add the display names of all tables to the listbox with a single call
+        if self.app_data.table_display_names:
+            self.listbox.insert(tk.END, *self.app_data.table_display_names)
 
         # Select button
         select_button = ttk.Button(self, text='Select', command=self.select_category)
@@ -77,7 +77,7 @@ class NewEntrySelectCategoryFrame(ttk.Frame):
             selected_item = self.listbox.get(selected_indices[0])
 
             # Store the selected category
-            self.app_data.selected_category = selected_item.replace(' ', '_').lower()
+            self.app_data.selected_category = self.app_data.display_to_raw[selected_item]
 
             # Proceed to EditEntryFrame
             self.controller.choose_next_frame("EditEntryFrame")
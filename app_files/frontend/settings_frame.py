@@ -2,6 +2,7 @@
 This class defines the SettingsFrame frame.
 """
 
+import tkinter as tk
 from tkinter import ttk, colorchooser
 
 class SettingsFrame(ttk.Frame):
@@ -34,6 +35,9 @@ class SettingsFrame(ttk.Frame):
         # Get theme names
         themes = self.style.theme_names()
 
+        # One variable shared by the radio buttons holds the chosen theme, starting with the current one
+        self.theme_var = tk.StringVar(self, value=self.style.theme_use())
+
         # Theme frame
         theme_frame = ttk.Frame(self)
         theme_frame.pack()
@@ -41,22 +45,16 @@ class SettingsFrame(ttk.Frame):
         # Theme label
         theme_label = ttk.Label(self, text='Please choose a theme:')
         theme_label.pack(pady=5, padx=5)
-        
-        # Create list to save radio buttons in
-        radio_buttons = []
 
         # Iterate through themes
         for theme in themes:
 
             # Theme radio button
-            radio = ttk.Radiobutton(self, text=theme, value=theme)
+            radio = ttk.Radiobutton(self, text=theme, value=theme, variable=self.theme_var)
             radio.pack(pady=5, padx=5)
 
-            # Store radio button
-            radio_buttons.append(radio)
-       
         # Save Theme button
-        theme_button = ttk.Button(self, text='Save Theme', command=lambda:self.save_theme(radio_buttons))
+        theme_button = ttk.Button(self, text='Save Theme', command=self.save_theme)
         theme_button.pack(pady=5, padx=5)
 
         # Choose Color Button
@@ -87,39 +85,21 @@ class SettingsFrame(ttk.Frame):
             # Unpack the color code of the tuple
             r, g, b = color_code[0]
 
-            # Get reverse of color
-            opposite_r = 255 - r
-            opposite_g = 255 - g
-            opposite_b = 255 - b
-
-            # Adjust the opposite color if it's too close to the background color
-            threshold = 50
-            if abs(r - opposite_r) < threshold:
-                opposite_r = 255 if r < 128 else 0
-            if abs(g - opposite_g) < threshold:
-                opposite_g = 255 if g < 128 else 0
-            if abs(b - opposite_b) < threshold:
-                opposite_b = 255 if b < 128 else 0
-
-            # Format the opposite color to a hexadecimal
-            opposite_color = '#{:02x}{:02x}{:02x}'.format(opposite_r, opposite_g, opposite_b)
+            # Use black text on light backgrounds and white text on dark ones, by relative luminance
+            luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+            opposite_color = '#000000' if luminance > 140 else '#ffffff'
 
             # Change the font color
             self.style.configure('.', foreground=opposite_color)
 
-    def save_theme(self, radio_buttons):
+    def save_theme(self):
         """
         This method saves the new theme for the main_app
 
-        Args:
-            radio_buttons: a list containing the radio buttons
-        
-        This function has no returns instead saves the theme
+        This function has no returns instead saves the theme selected in the radio buttons
         """
 
-        for radio in radio_buttons:
-            if radio.state():
-                self.style.theme_use(radio.cget("value"))
+        self.style.theme_use(self.theme_var.get())
 
     def back_one_frame(self):
         """
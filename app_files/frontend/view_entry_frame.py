@@ -2,11 +2,12 @@
 This class defines the ViewEntryFrame frame.
 """
 
-import io
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from .. import backend_logic
+from ..other_classes.thumbnail_cache import ThumbnailCache
+from ..other_classes.universal_handler import UniversalHandler
 
 class ViewEntryFrame(ttk.Frame):
     """
@@ -21,6 +22,10 @@ class ViewEntryFrame(ttk.Frame):
         app_data (object): An object that holds application-wide data, including selected entry details.
         text_widgets (dict): A dictionary containing text widgets for displaying entry details.
         image_data (bytes): Raw image data of the entry's photo, if available.
+        tag_window (tk.Toplevel): The window showing a double-clicked tag, reused for later tags.
+        original_photo (tuple): The image data and PhotoImage of the last original image shown.
+        displayed_image_data (bytes): The image data whose thumbnail was requested last.
+        tag_frames (dict): The ViewEntryFrame of each category built in the tag window, reused for later tags.
     """
 
     def __init__(self, parent, controller, app_data):
@@ -33,7 +38,8 @@ class ViewEntryFrame(ttk.Frame):
             app_data (object): An object containing application-wide data, such as selected entry details.
 
         The frame includes labels and widgets for displaying entry details, including textual information and an image.
-        Navigation buttons are provided for returning to the previous frame.
+        Navigation buttons are provided for returning to the previous frame. The entry details are built by build_entry
+        once the frame is shown.
         """
 
         # Create frame and store parent, controller, and app_data
@@ -45,14 +51,29 @@ class ViewEntryFrame(ttk.Frame):
         # Create variables to store as a class attribute
         self.text_widgets = {}
         self.image_data = None
+        self.original_photo = None
+        self.displayed_image_data = None
+        self.tag_window = None
+
+        # The ViewEntryFrame of each category built in the tag window
+        self.tag_frames = {}
+
+        # Whether build_entry has created the widgets yet
+        self.entry_built = False
+
+        # The entry's tags and the filtered tags of each filter option already chosen
+        self.tag_list = []
+        self.filter_cache = {}
+
+        # Pending idle callbacks of the resize handlers
+        self.scrollregion_after = None
+        self.canvas_width_after = None
+        self.canvas_width = 0
 
         # Guarded statement to enure a world is selected
         if not self.app_data.selected_world:
             return
 
-        # Get categories for entry by getting column names using session and selected_category
-        self.column_names = backend_logic.get_column_names(self.app_data.session, self.app_data.selected_category)
-
         # Entry Category label
         top_label = ttk.Label(self, text=f"{self.app_data.selected_category.title()} Entry:")
         top_label.pack(fill='both')
@@ -73,6 +94,38 @@ class ViewEntryFrame(ttk.Frame):
         separator = ttk.Separator(self, orient='horizontal')
         separator.pack(fill='x')
 
+        # Check if parent is main window or TopLevel window
+        if not isinstance(self.parent, tk.Toplevel):
+
+            # Back Button bound to go_back
+            back_button = ttk.Button(self, text="Back", command=self.go_back)
+            back_button.pack(side='bottom', pady=10)
+
+        # Placeholder shown until the entry is built
+        self.loading_label = ttk.Label(self, text="Loading...")
+        self.loading_label.pack(pady=5)
+
+        # Build the rest of the entry once the frame has been drawn
+        self.after_idle(self.build_entry)
+
+    def build_entry(self):
+        """
+        Builds the scrollable area with a label per column, the image and the tag widgets, then inserts the data.
+
+        Called from the event loop after the frame is first drawn, so the frame shows up before the entry is built.
+        """
+
+        # The frame was replaced before it was drawn
+        if not self.winfo_exists():
+            return
+
+        # Remove the placeholder
+        self.loading_label.destroy()
+
+        # Get the text categories for entry using session and selected_category
+        self.editable_columns = backend_logic.get_editable_columns(self.app_data.session,
+            self.app_data.selected_category)
+
         # Frame to hold the canvas widget for scrolling
         canvas_frame = ttk.Frame(self)
         canvas_frame.pack(fill='both', expand=True)
@@ -87,9 +140,8 @@ class ViewEntryFrame(ttk.Frame):
 
         # Scrollable frame
         self.inner_frame = ttk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.inner_frame, anchor='nw')
 
-        # Assign creation of window to an id for configuring the scrolling
+        # Place the scrollable frame on the canvas, assigning the window to an id for configuring the scrolling
         self.inner_frame_id = self.canvas.create_window(0, 0, window=self.inner_frame, anchor='nw')
 
         # Bind the configuration of the inner_frame to on_frame_configure method
@@ -104,19 +156,18 @@ class ViewEntryFrame(ttk.Frame):
         # Store the starting row
         current_row = 0
 
-        # Iterate through column_names
-        for column_name in self.column_names:
+        # The data of the entry, so each label is created with its text
+        entry_data = self.app_data.selected_entry_data or {}
 
-            # Check if column_name is in the following list and skip iteration if it is
-            if column_name in ["name", "tags", "image_data"]:
-                continue
+        # Iterate through the text columns
+        for column_name in self.editable_columns:
 
             # Label for column name
             label = tk.Label(self.inner_frame, text=column_name.title())
             label.grid(row=current_row, column=0, sticky="w", padx=5, pady=5)
 
             # Label for data
-            text = tk.Label(self.inner_frame)
+            text = tk.Label(self.inner_frame, text=entry_data.get(column_name, ''))
             text.grid(row=current_row + 1, column=1, sticky="n", padx=5, pady=5)
 
             # Store the text widget in dictionary with name
@@ -146,27 +197,49 @@ class ViewEntryFrame(ttk.Frame):
             tag_label = ttk.Label(self.inner_frame, text='Tags')
             tag_label.grid(row=current_row + 4, column=0, sticky="w", padx=5, pady=5)
 
-            # Create list of options for filtering tags
-            filter_options = [x.replace('_', ' ').title() for x in self.app_data.table_names if x != 'tags']
-            filter_options = ['All Categories'] + filter_options
-
             # Grid the tag listbox only if not Top Level Window
             self.tag_listbox.grid(row=current_row + 5, column=1, sticky="w", padx=5, pady=5)
 
             # Combobox to hold the filter options, bound to update_tag_listbox on selection
-            self.tag_filter_combobox = ttk.Combobox(self.inner_frame, values=filter_options, state='readonly')
+            self.tag_filter_combobox = ttk.Combobox(self.inner_frame, values=self.app_data.filter_options,
+                state='readonly')
             self.tag_filter_combobox.grid(row=current_row + 5, column=2, sticky='w')
             self.tag_filter_combobox.bind("<<ComboboxSelected>>", self.update_tag_listbox)
 
             # Bind the on_tag_double_click command
             self.tag_listbox.bind('<Double-1>', self.on_tag_double_click)
 
-            # Back Button bound to go_back
-            back_button = ttk.Button(self, text="Back", command=self.go_back)
-            back_button.pack(pady=10)
-
         # Insert data if exists
         self.insert_data()
+        self.entry_built = True
+
+    def reload_entry(self):
+        """
+        Shows the selected entry in the widgets already built, for a frame reused for another entry of its category.
+
+        The column labels are updated in place and the image and tags of the previous entry are cleared before
+        insert_data fills them again.
+        """
+
+        # build_entry has not run yet and will show the selected entry itself
+        if not self.entry_built:
+            return
+
+        # Update the column labels with the text of the selected entry
+        entry_data = self.app_data.selected_entry_data or {}
+        for column_name, text in self.text_widgets.items():
+            text.configure(text=entry_data.get(column_name, ''))
+
+        # Clear the image and the filtered tags of the previous entry
+        self.image_data = None
+        self.displayed_image_data = None
+        self.image.configure(image='')
+        self.image.image = None
+        self.filter_cache.clear()
+
+        # Scroll back to the top and insert the name, image and tags
+        self.canvas.yview_moveto(0)
+        self.insert_data()
 
     def go_back(self):
         """
@@ -187,8 +260,8 @@ class ViewEntryFrame(ttk.Frame):
         Inserts data into text widgets.
 
         If there is data for the selected entry (which there should be in View mode), this method inserts
-        it into the relating text widget. Note the text widgets are actually labels in read only mode but
-        the name text was kept to avoid confusion with the label tha describes the data.
+        the name, image and tags. The column labels (self.text_widgets) already get their text when build_entry
+        creates them.
         """
 
         # Guarded statement to ensure the existence of data
@@ -198,10 +271,7 @@ class ViewEntryFrame(ttk.Frame):
         # Save previous data to allow for frame reversal when closing the TopLevel window
         if not self.app_data.previous_entry_data:
             self.app_data.previous_entry_data = self.app_data.selected_entry_data
-
-        # Iterate through label_widgets and insert text
-        for table, textbox in self.text_widgets.items():
-            textbox.configure(text=self.app_data.selected_entry_data[table])
+            self.app_data.previous_category = self.app_data.selected_category
 
         # Inputs the name into the name label
         self.name_text.configure(text=self.app_data.selected_entry_data['name'])
@@ -209,7 +279,9 @@ class ViewEntryFrame(ttk.Frame):
         # Inputs image data if it exists
         if self.app_data.selected_entry_data['image_data']:
             self.image_data = self.app_data.selected_entry_data['image_data']
-            self.display_image(self.image_data)
+
+            # Show the stored thumbnail, entries saved before thumbnails existed fall back to the full image
+            self.display_image(self.app_data.selected_entry_data.get('thumb_data') or self.image_data)
 
         # Clear the Listbox
         self.tag_listbox.delete(0, tk.END)
@@ -217,38 +289,64 @@ class ViewEntryFrame(ttk.Frame):
         # Get list of tags
         existing_tags = self.app_data.selected_entry_data['tags'].split(', ')
 
-        # Iterate through existing tags
-        for tag in existing_tags:
+        # Ignore the entry's own name (to avoid an entry being tagged with itself)
+        tags_to_show = [tag for tag in existing_tags if tag != self.app_data.selected_entry_data['name']]
 
-            # Ignore iteration if tag is own name (to avoid an entry being tagged with itself)
-            if tag == self.app_data.selected_entry_data['name']:
-                continue
+        # Insert all tags into the list box with a single call
+        if tags_to_show:
+            self.tag_listbox.insert(tk.END, *tags_to_show)
 
-            # Insert current tag into list box
-            self.tag_listbox.insert(tk.END, tag)
+        # Keep the tags of this entry for filtering, app_data changes while a tag window is open
+        self.tag_list = [tag.strip() for tag in existing_tags]
 
     def on_frame_configure(self, event):
         """
-        Handles the canvas frame configuration change event.
+        Schedules an update of the canvas scroll region when the inner frame changes size.
+
+        Args:
+            event (tk.Event): The event object representing the configuration change event in the canvas.
+
+        Resizing fires bursts of configure events, so the scroll region is only recomputed once they are handled.
+        """
 
-        Adjusts the scroll region of the canvas to accommodate changes in the inner frame's size.
+        # An update is already scheduled
+        if self.scrollregion_after:
+            return
+
+        self.scrollregion_after = self.after_idle(self.update_scrollregion)
+
+    def update_scrollregion(self):
+        """
+        Configures the scrollregion to be the canvas bbox.
         """
 
+        self.scrollregion_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def on_canvas_configure(self, event):
         """
-        Adjusts the inner frame's width in response to canvas configuration changes.
+        Schedules an update of the inner frame's width when the canvas changes size.
 
         Args:
-            event (tk.Event): The event object triggered by canvas configuration changes.
+            event (tk.Event): The event object representing the configuration change event in the canvas.
 
-        This method is bound to the <Configure> event of the canvas widget. It adjusts the width of the inner frame
-        (self.inner_frame) within the canvas to match the canvas's width, ensuring that the inner frame fills the
-        available space horizontally.
+        Only the last width of a burst of configure events is applied.
         """
 
-        self.canvas.itemconfig(self.inner_frame_id, width=event.width)
+        # Keep the latest width, an update may already be scheduled
+        self.canvas_width = event.width
+        if self.canvas_width_after:
+            return
+
+        self.canvas_width_after = self.after_idle(self.update_inner_frame_width)
+
+    def update_inner_frame_width(self):
+        """
+        Adjusts the inner frame's width to the canvas width.
+        """
+
+        self.canvas_width_after = None
+        self.canvas.itemconfig(self.inner_frame_id, width=self.canvas_width)
 
     def display_image(self, image_data):
         """
@@ -257,19 +355,44 @@ class ViewEntryFrame(ttk.Frame):
         Args:
             image_data (bytes): The raw image data to be displayed.
 
-        This method opens the provided image using the Python Imaging Library (PIL), resizes it to fit the GUI if
-        necessary, converts it to the Tkinter PhotoImage format, and displays it in a label widget (self.image) within
-        the ViewEntryFrame.
+        Thumbnails cached by ThumbnailCache are shown right away. Otherwise the image is decoded and resized on the
+        database worker and shown in the label widget (self.image) once it is ready, so the frame is not blocked.
+        """
+
+        # Remember the image requested last, a slower decode of an earlier image must not replace it
+        self.displayed_image_data = image_data
+
+        # Show a cached thumbnail right away
+        photo = ThumbnailCache.get_cached_photo(image_data)
+        if photo:
+            self.show_photo(photo)
+            return
+
+        # Otherwise decode and resize the image in the background, then show it
+        self.app_data.db_worker.run(self, lambda image: self.show_decoded_image(image_data, image),
+            ThumbnailCache.create_image, image_data)
+
+    def show_decoded_image(self, image_data, image):
+        """
+        Shows a thumbnail decoded by the database worker, unless another image was requested since.
+
+        Args:
+            image_data (bytes): The raw image data the thumbnail was decoded from.
+            image (Image.Image): The thumbnail.
         """
 
-        # Open the image using PIL
-        image = Image.open(io.BytesIO(image_data))
+        if image_data is not self.displayed_image_data:
+            return
+
+        self.show_photo(ThumbnailCache.get_photo(image_data, image))
 
-        # Resample using Image.Resampling.LANCZOS for high-quality downsampling
-        image = image.resize((200, 200), Image.Resampling.LANCZOS)
+    def show_photo(self, photo):
+        """
+        Displays a thumbnail in the image label.
 
-        # Convert the image to Tkinter PhotoImage format
-        photo = ImageTk.PhotoImage(image)
+        Args:
+            photo (ImageTk.PhotoImage): The thumbnail.
+        """
 
         # Display the image in a label
         self.image.configure(image=photo)
@@ -290,32 +413,51 @@ class ViewEntryFrame(ttk.Frame):
         """
 
         # Check if the image data exists
-        if hasattr(self, 'image_data'):
+        if self.image_data:
 
-            # Open the original image using PIL
-            original_image = Image.open(io.BytesIO(self.image_data))
+            # Reuse the original image if it was already decoded
+            if self.original_photo and self.original_photo[0] is self.image_data:
+                self.show_original_image(self.original_photo[1])
+                return
 
-            # Create a new window to display the original image
-            original_window = tk.Toplevel(self.parent)
-            original_window.title("Original Image")
+            # Decode the original image in the background, reduced to the screen size where possible
+            image_data = self.image_data
+            screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+            self.app_data.db_worker.run(self, lambda image: self.show_original_image(image, image_data),
+                ThumbnailCache.create_original, image_data, screen_size)
 
-            # Create a label to display the original image
-            original_image_label = ttk.Label(original_window)
+        # If no image_data
+        else:
 
-            # Convert the original image to Tkinter PhotoImage format
-            original_photo = ImageTk.PhotoImage(original_image)
+            # If image data does not exist, show a message
+            messagebox.showinfo("No Image", "No image data available.")
 
-            # Display the original image in the label
-            original_image_label.configure(image=original_photo)
-            original_image_label.pack()
+    def show_original_image(self, image, image_data=None):
+        """
+        Shows the decoded original image in a new window.
 
-            # Keep a reference to avoid garbage collection
-            original_image_label.image = original_photo
+        Args:
+            image (Image.Image or ImageTk.PhotoImage): The decoded image, or its cached PhotoImage.
+            image_data (bytes): The raw data the image was decoded from, None if the PhotoImage was cached.
+        """
 
+        # Convert the original image to Tkinter PhotoImage format and keep it for the next time
+        if image_data is None:
+            original_photo = image
         else:
+            original_photo = ImageTk.PhotoImage(image)
+            self.original_photo = (image_data, original_photo)
 
-            # If image data does not exist, show a message
-            messagebox.showinfo("No Image", "No image data available.")
+        # Create a new window to display the original image
+        original_window = tk.Toplevel(self.parent)
+        original_window.title("Original Image")
+
+        # Display the original image in a label
+        original_image_label = ttk.Label(original_window, image=original_photo)
+        original_image_label.pack()
+
+        # Keep a reference to avoid garbage collection
+        original_image_label.image = original_photo
 
     def update_tag_listbox(self, event):
         """
@@ -329,24 +471,21 @@ class ViewEntryFrame(ttk.Frame):
         """
 
         # Retrieve the selected option from the tag filter combobox
-        selected_option = self.tag_filter_combobox.get().replace(' ', '_').lower()
-
-        # Retrieve tag list from selected data and stript any unwanted spaces
-        tag_list = self.app_data.selected_entry_data['tags'].split(',')
-        tag_list = [tag.strip() for tag in tag_list]
+        selected_option = self.app_data.display_to_raw.get(self.tag_filter_combobox.get(), 'all_categories')
 
-        # Filter the tags using the backend logic filtering function
-        filtered_tags = backend_logic.filter_tag_list_by_table(self.app_data.session,
-            self.app_data.url, tag_list, selected_option)
+        # Filter the tags using the backend logic filtering function, once per filter option
+        filtered_tags = self.filter_cache.get(selected_option)
+        if filtered_tags is None:
+            filtered_tags = backend_logic.filter_tag_list_by_table(self.app_data.session,
+                self.app_data.url, self.tag_list, selected_option)
+            self.filter_cache[selected_option] = filtered_tags
 
         # Delete all tags in listbox
         self.tag_listbox.delete(0, tk.END)
 
-        # Iterate through the filtered tags
-        for tag in filtered_tags:
-
-            # Insert the current tag
-            self.tag_listbox.insert(tk.END, tag)
+        # Insert the filtered tags with a single call
+        if filtered_tags:
+            self.tag_listbox.insert(tk.END, *filtered_tags)
 
     def on_tag_double_click(self, event):
         """
@@ -363,21 +502,52 @@ class ViewEntryFrame(ttk.Frame):
         selected_index = self.tag_listbox.curselection()
         selected_tag = self.tag_listbox.get(self.tag_listbox.curselection())
 
-        # Retrieve information about the selected tag
-        self.app_data.selected_entry_data = backend_logic.get_data_for_entry(self.app_data.session,
-            selected_tag, self.app_data.url)
-        self.app_data.selected_category = backend_logic.get_tag_location(self.app_data.session,
-            selected_tag, self.app_data.url)
+        # Retrieve the data and category of the selected tag in the background, then show it
+        self.app_data.db_worker.submit(self, lambda result: self.open_tag_window(result, selected_index),
+            backend_logic.get_entry_with_location, self.app_data.url, selected_tag, self.app_data.url)
+
+    def open_tag_window(self, result, selected_index):
+        """
+        Shows the retrieved tag entry in the tag window, creating the window if needed.
+
+        Args:
+            result (tuple): The data of the tag entry and the name of its table.
+            selected_index (tuple): The index of the tag in the tag listbox.
+        """
 
-        # Create a new Toplevel window and configure size and closing
-        new_window = tk.Toplevel(self.parent)
-        new_window.geometry("700x600")
-        new_window.protocol("WM_DELETE_WINDOW", lambda: self.on_window_close(new_window))
+        # Store the data and category of the selected tag
+        self.app_data.selected_entry_data, self.app_data.selected_category = result
 
-        # Create a new instance of EditEntryFrame with the info from the selected tag
-        new_frame = ViewEntryFrame(new_window, self.controller, self.app_data)
+        # Reuse the open tag window
+        if self.tag_window and self.tag_window.winfo_exists():
+            new_window = self.tag_window
 
-        # Pack the EditEntryFrame into the new window
+        # Otherwise create a new Toplevel window and configure size and closing
+        else:
+            new_window = tk.Toplevel(self)
+            new_window.geometry("700x600")
+            new_window.protocol("WM_DELETE_WINDOW", lambda: self.on_window_close(new_window))
+            self.tag_window = new_window
+            self.tag_frames = {}
+
+            # Bind scroll events once per window, the binding goes away with the window
+            UniversalHandler.bind_scroll_event(new_window)
+
+        # Hide the frame of the entry shown before
+        for frame in self.tag_frames.values():
+            frame.pack_forget()
+
+        # Reuse the frame already built for the category, showing the selected entry in its widgets
+        new_frame = self.tag_frames.get(self.app_data.selected_category)
+        if new_frame:
+            new_frame.reload_entry()
+
+        # Otherwise create a new instance of ViewEntryFrame with the info from the selected tag
+        else:
+            new_frame = ViewEntryFrame(new_window, self.controller, self.app_data)
+            self.tag_frames[self.app_data.selected_category] = new_frame
+
+        # Pack the ViewEntryFrame into the tag window
         new_frame.pack(expand=True, fill="both", pady=20, padx=20)
 
         # Deselect the tag after opening the new window
@@ -390,25 +560,17 @@ class ViewEntryFrame(ttk.Frame):
         Args:
             window (tk.Toplevel): The Toplevel window to be closed.
 
-        This method unbinds mouse wheel events from the canvas, destroys the provided window, and resets the application
+        This method destroys the provided window, which also removes its scroll bindings, and resets the application
         state to the previously selected entry data and category.
         """
 
         # Destroy the window
         window.destroy()
+        self.tag_window = None
+        self.tag_frames = {}
 
-        # Retrieve the previous data as the selected data
+        # Retrieve the previous data as the selected data, the frame itself still shows it
         self.app_data.selected_entry_data = self.app_data.previous_entry_data
 
-        # Set the previous data to None
-        self.app_data.previous_entry_data = None
-
-        # Update the selected category with the selected entry data
-        self.app_data.selected_category = backend_logic.get_tag_location(self.app_data.session,
-            self.app_data.selected_entry_data['name'], self.app_data.url)
-
-        # Instantiate new ViewEntryFrame with the selected entry data
-        new_frame = ViewEntryFrame(self.parent, self.controller, self.app_data)
-
-        # Show new instance of ViewEntryFrame
-        self.controller.show_frame(new_frame)
+        # Restore the category stored with the previous data, no lookup needed
+        self.app_data.selected_category = self.app_data.previous_category
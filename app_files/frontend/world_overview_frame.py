@@ -4,7 +4,8 @@ This class defines the frame for the World Overview Frame.
 
 import io
 import tkinter as tk
-from tkinter import ttk, filedialog
+from pathlib import Path
+from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
 
 from .. import backend_logic
@@ -22,15 +23,23 @@ class WorldOverviewFrame(ttk.Frame):
             controller (tk.Widget): The controller widget responsible for managing application flow.
             app_data (AppData): An instance of the AppData class containing application-wide data.
             label_text_var (tk.StringVar): Variable to hold the text for displaying the selected world name.
-            listbox_dict (dict): A dictionary mapping category names to their respective listbox widgets.
+            tree (ttk.Treeview): The tree holding a node per category, with the category's entries as children.
+            entry_names (dict): The entry names of each category, None until they are loaded.
+            open_categories (set): The categories to open again when the tree is refreshed.
+            url (str): The URL of the world the frame is built for.
+            edit (bool): The mode the frame is built for.
 
         Methods:
-            create_dynamic_category_widgets(): Creates dynamic category widgets based on available tables in the 
-                database.
+            create_dynamic_category_widgets(): Creates the tree of categories and entries.
             update_label_text(): Updates the label text to display the selected world name.
-            update_listboxes(): Updates the listboxes with entry names for each category.
-            on_double_click(event, table_name): Handles double-click events on listbox items to view or edit 
-                entry details.
+            create_category_nodes(table_names): Adds a node for each category to the tree.
+            fill_entry_names(entries_by_table): Stores the retrieved entry names of all categories.
+            can_reuse(): Checks whether the frame can be shown again for the current world and mode.
+            refresh(): Reloads the categories and entries of a reused frame.
+            on_tree_open(event): Fills a category with its entries when it is opened.
+            fill_category(table_name): Replaces the placeholder of a category with its entries.
+            on_double_click(event): Handles double-click events on entries to view or edit entry details.
+            open_entry(table_name, data): Opens a retrieved entry in the edit or view frame.
             select_map(): Opens a file dialog to select an image file for the world map.
             save_image(image_data): Saves the selected image data as the world map in the database.
             view_map(): Retrieves and displays the world map from the database in a new window.
@@ -64,6 +73,13 @@ class WorldOverviewFrame(ttk.Frame):
         self.app_data = app_data
         self.map_photo = None
 
+        # Label shown while a double clicked entry loads
+        self.loading_label = ttk.Label(self, text="Loading...")
+
+        # The world and mode the frame is built for, it is only reused for the same ones
+        self.url = app_data.url
+        self.edit = app_data.edit
+
         # Create StringVar for World Label
         self.label_text_var = tk.StringVar()
         self.label_text_var.set(self.app_data.selected_world)
@@ -80,7 +96,7 @@ class WorldOverviewFrame(ttk.Frame):
         self.view_map_button.pack(pady=10)
 
         # Check if world map exists
-        if not backend_logic.veiw_world_map(app_data.session, app_data.url):
+        if not backend_logic.has_world_map(app_data.session, app_data.url):
 
             # Diable button
             self.view_map_button.config(state=tk.DISABLED)
@@ -109,11 +125,10 @@ class WorldOverviewFrame(ttk.Frame):
 
     def create_dynamic_category_widgets(self):
         """
-            Dynamically creates widgets for displaying categories and entries.
+            Dynamically creates the tree of categories and entries.
 
-            Retrieves table names from the application data session.
-            Constructs frames, labels, and listboxes for each category.
-            Binds double-click events on listboxes to handle entry selection.
+            Builds the tree and its scrollbar synchronously, then retrieves the table names on the database worker.
+            A node for each category is added once the names arrive, and its entries are added when it is opened.
 
             Note:
                 This method is called to populate the frame with dynamic widgets representing categories and entries.
@@ -125,110 +140,219 @@ class WorldOverviewFrame(ttk.Frame):
         if not self.app_data.session:
             return
 
-        table_names = backend_logic.get_table_names(self.app_data.session)
-        self.app_data.table_names = table_names
+        # Frame to hold the tree and its scrollbar
+        tree_frame = ttk.Frame(self)
+        tree_frame.pack(fill="both", expand=True)
 
-        num_columns = 3
+        # One tree holds every category and its entries
+        self.tree = ttk.Treeview(tree_frame, show='tree', selectmode='browse')
+        self.tree.pack(side="left", fill="both", expand=True, padx=5)
 
-        # Canvas widget to allow scrolling
-        canvas_frame = ttk.Frame(self)
-        canvas_frame.pack(fill="both", expand=True)
+        # Scroll bar widget packed to the right
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        scrollbar.pack(side="right", fill="y")
 
-        self.canvas = tk.Canvas(canvas_frame)
-        self.canvas.pack(side="left", fill="both", expand=True, padx=5)
+        # Configure the scrollbar and tree
+        self.tree.config(yscrollcommand=scrollbar.set)
 
-        # Create frame to hold frames created below and create the scrollable window
-        category_frames = ttk.Frame(self.canvas)
+        # Fill categories when they are opened, open entries on double click
+        self.tree.bind('<<TreeviewOpen>>', self.on_tree_open)
+        self.tree.bind('<Double-1>', self.on_double_click)
 
-        # Scroll bar widget packed to the right
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
-        scrollbar.pack(side="right", fill="y")
+        # Entry names of every table, filled by fill_entry_names
+        self.entry_names = None
 
-        # Configure the scrollbar and canvas
-        self.canvas.config(yscrollcommand=scrollbar.set)
+        # Categories to open again when the tree is refreshed
+        self.open_categories = set()
 
-        # Bind events
-        category_frames.bind("<Configure>", lambda event, canvas=self.canvas: self.on_canvas_configure(canvas))
-        self.canvas.bind('<Configure>', self.on_canvas_resize)
+        # Retrieve the table names in the background and add the categories once they arrive
+        self.app_data.db_worker.submit(self, self.create_category_nodes, backend_logic.get_table_names,
+            self.app_data.url)
 
-        # Create the window within the canvas
-        self.canvas_window = self.canvas.create_window((0, 0), window=category_frames, anchor="nw")
+    def create_category_nodes(self, table_names):
+        """
+        Adds a closed node for every category to the tree and starts loading the entry names.
 
-        # Create listbox dictionary to hold the entry listboxes
-        self.listbox_dict = {}
+        Args:
+            table_names (list): The names of the category tables.
 
-        for i in range(0, len(table_names), num_columns):
-            category_frame = ttk.Frame(category_frames)
-            category_frame.pack(fill='both', side=tk.TOP, pady=10)
+        Returns:
+            None
+        """
 
-            for x in range(i, min(i + num_columns, len(table_names))):
-                individual_frame = ttk.Frame(category_frame)
-                individual_frame.pack(side=tk.LEFT, fill='both', expand=True)  # Adjusted packing
+        # Guard against a failed table lookup
+        if not table_names:
+            return
 
-                label = ttk.Label(individual_frame, text=table_names[x].replace('_', ' ').title())
-                label.pack(side=tk.TOP)
+        # Store the table names and their display names
+        self.app_data.set_table_names(table_names)
 
-                listbox = tk.Listbox(individual_frame, height=10)
-                listbox.pack(side=tk.TOP, padx=10, fill='both', expand=True)  # Adjusted packing
+        # Add a node per category, the placeholder child lets it be opened before its entries are added
+        for table_name, display_name in zip(table_names, self.app_data.table_display_names):
 
-                listbox.bind('<Double-1>', lambda event,
-                    table_name=table_names[x]: self.on_double_click(event, table_name))
+            # Skip categories added by an earlier lookup that finished late
+            if self.tree.exists(table_name):
+                continue
 
-                self.listbox_dict[table_names[x]] = listbox
+            self.tree.insert('', tk.END, iid=table_name, text=display_name,
+                open=table_name in self.open_categories)
+            self.tree.insert(table_name, tk.END, iid=f'{table_name}/placeholder', text='Loading...')
 
+        # Retrieve the entries of all tables in the background with one query
+        self.app_data.db_worker.submit(self, self.fill_entry_names,
+            backend_logic.get_all_entry_names, self.app_data.url, self.app_data.url)
 
-        # Update the listboxes within the frame
-        self.update_listboxes()
+    def fill_entry_names(self, entries_by_table):
+        """
+        Stores the retrieved entry names and fills any categories that were opened while they loaded.
+
+        Args:
+            entries_by_table (dict): The entry names of each table, keyed by table name.
 
-    def update_listboxes(self):
+        Returns:
+            None
         """
-        Update the listboxes with entries retrieved from the database.
 
-        Retrieves entry names for each table from the database using the session and URL
-        stored in the AppData instance. Iterates over each table name and corresponding
-        listbox in the dictionary of listboxes. For each table name, retrieves entry names
-        using backend_logic.get_entry_names() and inserts them into the corresponding listbox.
+        self.entry_names = entries_by_table
+
+        # Fill the categories that are already open
+        for table_name in self.tree.get_children():
+            if self.tree.item(table_name, 'open'):
+                self.fill_category(table_name)
+
+    def can_reuse(self):
+        """
+        Checks whether the frame can be shown again for the current world and mode.
+
+        Returns:
+            bool: True if the frame was built for the selected world and mode.
+        """
+
+        return hasattr(self, 'tree') and self.url == self.app_data.url and self.edit == self.app_data.edit
+
+    def refresh(self):
+        """
+        Reloads the categories and entries of a reused frame, keeping open categories open.
 
         Returns:
             None
         """
-        # Iterate through tables and listboxes in the frame
-        for table_name, listbox in self.listbox_dict.items():
 
-            # Retrieve entries for current table
-            entries = backend_logic.get_entry_names(self.app_data.session, table_name, self.app_data.url)
+        # Hide the loading label of the entry opened last
+        self.loading_label.place_forget()
 
-            # Check if entries has data
-            if entries:
+        # Remember the open categories and clear the tree
+        self.open_categories = {table_name for table_name in self.tree.get_children()
+            if self.tree.item(table_name, 'open')}
+        self.tree.delete(*self.tree.get_children())
+        self.entry_names = None
 
-                # Iterate through the entries
-                for entry in entries:
+        # Retrieve the table names in the background and add the categories again once they arrive
+        self.app_data.db_worker.submit(self, self.create_category_nodes, backend_logic.get_table_names,
+            self.app_data.url)
 
-                    # Insert the entry into the listbox
-                    listbox.insert(tk.END, entry)
+    def on_tree_open(self, event):
+        """
+        Fills the category that was opened with its entries.
+
+        Args:
+            event (tk.Event): The event object representing the open event.
 
-    def on_double_click(self, event, table_name):
+        Returns:
+            None
         """
-        Handle double-click events on listbox items.
 
-        Retrieves the selected item from the event and uses it to get data for the entry
-        from the database using backend_logic.get_data_for_entry(). Updates the selected
-        entry data and category in the AppData instance. If in edit mode, navigates to the
-        EditEntryFrame; otherwise, navigates to the ViewEntryFrame.
+        # Entries are still loading, fill_entry_names fills the category once they arrive
+        if self.entry_names is None:
+            return
+
+        # Only categories are opened, entries have no children
+        table_name = self.tree.focus()
+        if self.tree.parent(table_name) == '':
+            self.fill_category(table_name)
+
+    def fill_category(self, table_name):
+        """
+        Replaces the placeholder of a category with its entries, once.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            None
+        """
+
+        # Only replace the placeholder, the category may have been filled before
+        placeholder = f'{table_name}/placeholder'
+        if not self.tree.exists(placeholder):
+            return
+
+        self.tree.delete(placeholder)
+
+        # Insert an item per entry, looking up the insert method and end index once for large categories
+        insert, end = self.tree.insert, tk.END
+        for entry in self.entry_names.get(table_name, ()):
+            insert(table_name, end, text=entry)
+
+    def on_double_click(self, event):
+        """
+        Handle double-click events on entries in the tree.
+
+        Retrieves the selected entry and its category from the tree and gets the data for the entry on the
+        database worker using backend_logic.get_data_for_entry(). The entry is opened by
+        open_entry once the data arrives.
 
         Args:
             event (tk.Event): The event object representing the double-click event.
-            table_name (str): The name of the table associated with the listbox.
 
         Returns:
             None
         """
 
+        # Get the item that was double clicked and its category
+        item = self.tree.focus()
+        table_name = self.tree.parent(item)
+
+        # Ignore double clicks on categories and on nothing
+        if not item or table_name == '':
+            return
+
         # Retrieve the entry that was double clicked
-        selected_item = event.widget.get(event.widget.curselection())
+        selected_item = self.tree.item(item, 'text')
+
+        # Show that the entry is loading until the frame is replaced
+        self.loading_label.place(x=0, y=0)
+
+        # Retrieve the data for the entry in the background, then open it
+        self.app_data.db_worker.submit(self, lambda data: self.open_entry(table_name, data),
+            backend_logic.get_data_for_entry, self.app_data.url, selected_item, self.app_data.url,
+            error_callback=self.show_load_error)
+
+    def show_load_error(self, error):
+        """
+        Hides the loading label and tells the user that the entry could not be loaded.
+
+        Args:
+            error (Exception): The exception raised while loading the entry.
+
+        Returns:
+            None
+        """
+
+        self.loading_label.place_forget()
+        messagebox.showerror("Error", f"The entry could not be loaded: {error}")
 
-        # Retrieve the data for the entry
-        data = backend_logic.get_data_for_entry(self.app_data.session, selected_item, self.app_data.url)
+    def open_entry(self, table_name, data):
+        """
+        Opens the retrieved entry in the EditEntryFrame or ViewEntryFrame depending on the mode.
+
+        Args:
+            table_name (str): The name of the table the entry belongs to.
+            data (dict): The data of the entry.
+
+        Returns:
+            None
+        """
 
         # Store the data in the app_data class
         self.app_data.selected_entry_data = data
@@ -245,8 +369,8 @@ class WorldOverviewFrame(ttk.Frame):
     def select_map(self):
         """
         Opens a file dialog for the user to select a map image file. If a file is selected,
-        reads the file, converts it to bytes, and calls the save_image method to handle the
-        image data persistence.
+        reads the file as bytes on the database worker and calls the save_image method to handle
+        the image data persistence.
 
         This method allows users to select an image that represents a world map, which is
         then stored in the application's backend storage system for later retrieval and display.
@@ -261,15 +385,8 @@ class WorldOverviewFrame(ttk.Frame):
         # Check for file
         if file_path:
 
-            # Read the image file and convert it to bytes
-            with open(file_path, 'rb') as file:
-                image_data = file.read()
-
-            # Display the selected image
-            self.save_image(image_data)
-
-        # Enable view map button
-        self.view_map_button.config(state=tk.NORMAL)
+            # Read the image file as bytes in the background, then save it
+            self.app_data.db_worker.run(self, self.save_image, Path(file_path).read_bytes)
 
     def save_image(self, image_data):
         """
@@ -289,6 +406,9 @@ class WorldOverviewFrame(ttk.Frame):
         # Save the image using the add_world_map function
         backend_logic.add_world_map(self.app_data.session, image_data, self.app_data.url)
 
+        # Enable view map button
+        self.view_map_button.config(state=tk.NORMAL)
+
     def view_map(self):
         """
         Retrieves map data from the database, converts it to an image, and displays it in a new window.
@@ -305,42 +425,14 @@ class WorldOverviewFrame(ttk.Frame):
         # Get map data from database
         map_data = backend_logic.veiw_world_map(self.app_data.session, self.app_data.url)
 
-        # Convert data to image
-        image = Image.open(io.BytesIO(map_data))
-
         # Create new window titled World Map
         map_window = tk.Toplevel(self.parent)
         map_window.title("World Map")
 
-        # Reference image as tk.PhotoImage and save as class object to aviod garbage collection
-        self.map_photo = ImageTk.PhotoImage(image)
+        # Reference image as tk.PhotoImage and save as class object to aviod garbage collection, closing the image
+        with Image.open(io.BytesIO(map_data)) as image:
+            self.map_photo = ImageTk.PhotoImage(image)
 
         # Display photo in map window
         label = ttk.Label(map_window, image=self.map_photo)
         label.pack()
-
-    def frame_width(self, event):
-        """
-        Adjust the width of the canvas when resized.
-        """
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-
-    def on_frame_configure(self, event):
-        """
-        Configure the scroll region on the canvas to the entire size of the canvas
-        once the frame is created.
-        """
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def on_canvas_configure(self, canvas):
-        """
-        Adjusts the scroll region of the canvas when the size of the canvas window changes.
-        """
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    def on_canvas_resize(self, event):
-        """
-        Adjusts the size of the canvas window when the size of the canvas changes.
-        """
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
@@ -102,7 +102,7 @@ class WorldSelectionFrame(ttk.Frame):
         Retrieves the selected world name and edit mode from the UI elements.
         Sets the edit mode in the application data accordingly.
         Retrieves the database URL for the selected world from the application data.
-        Creates a session with the database URL.
+        Reuses the session kept for the database URL, creating it on first use.
         Updates the selected world in the application data.
         Shows the WorldOverviewFrame.
 
@@ -127,8 +127,8 @@ class WorldSelectionFrame(ttk.Frame):
         database_url = self.worlds[selected_world]
         self.app_data.url = database_url
 
-        # Create a session with the database URL
-        self.app_data.session = backend_logic.create_session_by_url(database_url)
+        # Reuse the session of the database URL, creating it on first use
+        self.app_data.session = self.app_data.get_or_create_session(database_url)
         self.app_data.selected_world = selected_world
 
         # Handle the selected world and edit mode
@@ -140,7 +140,7 @@ class WorldSelectionFrame(ttk.Frame):
 
         Generates a new database URL by invoking the 'create_database' function from the backend logic module.
         If the database URL is successfully created:
-            - Establishes a session with the new database URL using 'create_session_by_url'.
+            - Establishes a session with the new database URL using 'AppData.get_or_create_session'.
             - Navigates to the WorldOverviewFrame to display the newly created world.
 
         If the database URL creation fails, no action is taken.
@@ -159,7 +159,8 @@ class WorldSelectionFrame(ttk.Frame):
         if database_url:
 
             # Establish a session with the new database URL
-            self.app_data.session = backend_logic.create_session_by_url(database_url)
+            self.app_data.url = database_url
+            self.app_data.session = self.app_data.get_or_create_session(database_url)
 
             # Navigate to the WorldOverviewFrame to display the newly created world
             self.controller.choose_next_frame("WorldOverviewFrame")
@@ -2,6 +2,9 @@
 This class to handle data that needs to be passed around the mainwindow
 """
 
+from .. import backend_logic
+from .database_worker import DatabaseWorker
+
 class AppData:
     """
     Represents shared data between frames in the application.
@@ -9,16 +12,25 @@ class AppData:
     Attributes:
         selected_world (str): The selected database to work on or view.
         table_names (list): The names of tables within the database, allowing for schema updates.
+        table_display_names (tuple): The table names formatted for display, in the order of table_names.
+        filter_options (tuple): The tag filter choices, 'All Categories' followed by the display names.
+        display_to_raw (dict): Maps each display name back to its table name.
         selected_category (str): The category selected when choosing which entry to work on.
         selected_entry_data (dict): The data of the selected entry stored as a dictionary.
         previous_entry_data (dict): The data of the previously selected entry stored as a dictionary.
+        previous_category (str): The category of the previously selected entry.
         previous_frame: (obj): The reference to the previously displayed frame.
         session: (obj): The SQLAlchemy session used for various backend operations.
         url: (str): The SQLAlchemy URL for the selected database.
         edit: (bool): Indicates the mode selected, where True represents "Edit" mode and False represents "View" mode.
+        db_worker: (DatabaseWorker): Runs database queries off the Tk main thread.
+        sessions: (dict): The main thread's session of each database URL opened so far, kept until the app closes.
 
     Methods:
         __init__(): Initializes the AppData object by creating attributes.
+        set_table_names(table_names): Stores the table names along with their display names.
+        get_or_create_session(url): Returns the session kept for a database URL, creating it on first use.
+        close_sessions(): Closes every kept session.
     """
 
     def __init__(self):
@@ -29,10 +41,54 @@ class AppData:
         """
         self.selected_world = None
         self.table_names = []
+        self.table_display_names = ()
+        self.filter_options = ()
+        self.display_to_raw = {}
         self.selected_category = None
         self.selected_entry_data = None
         self.previous_entry_data = None
+        self.previous_category = None
         self.previous_frame = None
         self.session = None
         self.url = None
         self.edit = None
+        self.db_worker = DatabaseWorker()
+        self.sessions = {}
+
+    def set_table_names(self, table_names):
+        """
+        Stores the table names and formats their display names once, so frames can look them up.
+
+        Args:
+            table_names (list): The names of tables within the database.
+        """
+        self.table_names = table_names
+        self.table_display_names = tuple(name.replace('_', ' ').title() for name in table_names)
+        self.filter_options = ('All Categories',) + self.table_display_names
+        self.display_to_raw = dict(zip(self.table_display_names, table_names))
+
+    def get_or_create_session(self, url):
+        """
+        Returns the session kept for a database URL, creating it the first time the URL is used.
+
+        Sessions are created with expire_on_commit=False, so reusing one across frames and world selections
+        does not reload objects after every commit.
+
+        Args:
+            url (str): The SQLAlchemy URL of the database.
+
+        Returns:
+            Session: The session for the database.
+        """
+        if url not in self.sessions:
+            self.sessions[url] = backend_logic.create_session_by_url(url)
+        return self.sessions[url]
+
+    def close_sessions(self):
+        """
+        Closes every kept session.
+        """
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+        self.session = None
@@ -0,0 +1,124 @@
+"""
+This utility class runs database queries off the Tk main thread.
+"""
+
+import traceback
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import backend_logic
+
+class DatabaseWorker:
+    """
+    Runs backend_logic functions and other slow work on worker threads and hands their results back to the Tk
+    main loop.
+
+    Each job opens its own session, so the SQLAlchemy session used by the main thread is never shared
+    between threads. Results are collected by polling from the main loop with after(), since Tk widgets
+    must only be touched from the thread running mainloop.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The pool the queries run on.
+        poll_interval (int): Milliseconds between checks for a finished query.
+    """
+
+    def __init__(self, max_workers=2, poll_interval=10):
+        """
+        Initializes the DatabaseWorker and its thread pool.
+
+        Args:
+            max_workers (int): The number of worker threads.
+            poll_interval (int): Milliseconds between checks for a finished query.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="database_worker")
+        self.poll_interval = poll_interval
+
+    def submit(self, widget, callback, function, database_url, *args, error_callback=None):
+        """
+        Runs a backend_logic function in the background and passes its result to callback.
+
+        Args:
+            widget (tk.Widget): The widget whose event loop receives the result.
+            callback (callable): Called on the main thread with the function's return value.
+            function (callable): The backend_logic function, called as function(session, *args).
+            database_url (str): The URL of the database to open the session on.
+            *args: The remaining arguments for function.
+            error_callback (callable): Called on the main thread with the exception if the function raises.
+
+        Returns:
+            Future: The future of the running query.
+        """
+
+        return self.run(widget, callback, self._run, function, database_url, *args, error_callback=error_callback)
+
+    def run(self, widget, callback, function, *args, error_callback=None):
+        """
+        Runs a function that needs no session in the background and passes its result to callback.
+
+        Args:
+            widget (tk.Widget): The widget whose event loop receives the result.
+            callback (callable): Called on the main thread with the function's return value.
+            function (callable): The function, called as function(*args). It must not touch Tk widgets.
+            *args: The arguments for function.
+            error_callback (callable): Called on the main thread with the exception if the function raises.
+
+        Returns:
+            Future: The future of the running function.
+        """
+
+        # Run the function on a worker thread
+        future = self.executor.submit(function, *args)
+
+        # Wait for the result from the main loop
+        self._poll(widget, future, callback, error_callback)
+
+        return future
+
+    @staticmethod
+    def _run(function, database_url, *args):
+        """
+        Calls function with a session of its own, closing the session afterwards.
+        """
+
+        with backend_logic.create_session_by_url(database_url) as session:
+            return function(session, *args)
+
+    def _poll(self, widget, future, callback, error_callback=None):
+        """
+        Hands the result to callback, or the exception to error_callback, once the query is done,
+        or checks again later.
+        """
+
+        try:
+
+            # Check again later if the query is still running
+            if not future.done():
+                widget.after(self.poll_interval, self._poll, widget, future, callback, error_callback)
+                return
+
+            # Drop the result if the widget was destroyed in the meantime
+            if not widget.winfo_exists():
+                return
+
+        # The application was closed
+        except tk.TclError:
+            return
+
+        # Report a failed query instead of passing it on
+        error = future.exception()
+        if error:
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+            # Let the caller undo its pending state and tell the user
+            if error_callback:
+                error_callback(error)
+            return
+
+        callback(future.result())
+
+    def shutdown(self):
+        """
+        Stops the worker threads, cancelling any queries that have not started.
+        """
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
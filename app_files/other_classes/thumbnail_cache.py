@@ -0,0 +1,126 @@
+"""
+This utility class caches the resized entry images shown in the entry frames.
+"""
+
+import io
+import hashlib
+from collections import OrderedDict
+from PIL import Image, ImageTk
+
+from .. import backend_logic
+
+class ThumbnailCache:
+    """
+    Keeps the most recently shown thumbnails so showing an entry again skips decoding and resizing.
+
+    Thumbnails are keyed by a hash of the image data, and the least recently used thumbnail is
+    dropped once the cache holds MAX_SIZE thumbnails.
+
+    Attributes:
+        MAX_SIZE (int): The number of thumbnails to keep.
+    """
+
+    MAX_SIZE = 64
+
+    _photos = OrderedDict()
+
+    @staticmethod
+    def _key(image_data):
+        """
+        Returns the cache key of the image data.
+        """
+        return hashlib.blake2b(image_data, digest_size=8).digest()
+
+    @staticmethod
+    def create_image(image_data):
+        """
+        Decodes the image data and shrinks it to fit the thumbnail size, keeping its aspect ratio.
+
+        Only PIL is used here, so this is safe to call from a worker thread.
+
+        Args:
+            image_data (bytes): The raw image data.
+
+        Returns:
+            Image.Image: The thumbnail.
+        """
+
+        # Same thumbnail as the one stored with the entry
+        return backend_logic.create_thumbnail_image(image_data)
+
+    @staticmethod
+    def create_original(image_data, screen_size):
+        """
+        Decodes the full image, letting JPEGs larger than the screen decode at a reduced scale.
+
+        Only PIL is used here, so this is safe to call from a worker thread.
+
+        Args:
+            image_data (bytes): The raw image data.
+            screen_size (tuple): The width and height of the screen.
+
+        Returns:
+            Image.Image: The decoded image.
+        """
+
+        # Open the image using PIL, closing it once the pixels are loaded
+        with Image.open(io.BytesIO(image_data)) as image:
+
+            # Decode at the smallest DCT scale that still covers the screen
+            image.draft('RGB', screen_size)
+
+            # Load the pixels before the file is closed
+            image.load()
+            return image.copy()
+
+    @classmethod
+    def get_cached_photo(cls, image_data):
+        """
+        Returns the cached thumbnail of the image data, marking it as most recently used.
+
+        Must be called from the Tk main thread.
+
+        Args:
+            image_data (bytes): The raw image data.
+
+        Returns:
+            ImageTk.PhotoImage or None: The thumbnail, None if it is not cached.
+        """
+
+        key = cls._key(image_data)
+
+        if key in cls._photos:
+            cls._photos.move_to_end(key)
+            return cls._photos[key]
+
+        return None
+
+    @classmethod
+    def get_photo(cls, image_data, image=None):
+        """
+        Returns a thumbnail of the image data as a PhotoImage, decoding it only if it is not cached.
+
+        Must be called from the Tk main thread.
+
+        Args:
+            image_data (bytes): The raw image data.
+            image (Image.Image): The thumbnail if it was already created with create_image.
+
+        Returns:
+            ImageTk.PhotoImage: The thumbnail.
+        """
+
+        # Return the cached thumbnail, marking it as most recently used
+        photo = cls.get_cached_photo(image_data)
+        if photo:
+            return photo
+
+        # Convert the thumbnail to Tkinter PhotoImage format
+        photo = ImageTk.PhotoImage(image or cls.create_image(image_data))
+
+        # Store the thumbnail, dropping the least recently used one when full
+        cls._photos[cls._key(image_data)] = photo
+        if len(cls._photos) > cls.MAX_SIZE:
+            cls._photos.popitem(last=False)
+
+        return photo
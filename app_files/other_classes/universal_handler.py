@@ -5,6 +5,7 @@ specfic code.
 
 import sys
 import os
+import tkinter as tk
 
 class UniversalHandler:
     """
@@ -41,8 +42,8 @@ class UniversalHandler:
                 # Skip the rest of the loop
                 continue
 
-            # If listbox is current widget name
-            if 'listbox' in str(widget).rsplit('!', maxsplit=1):
+            # If current widget is a listbox
+            if isinstance(widget, tk.Listbox):
 
                 # If listbox size is not greater than listbox height
                 if not widget.size() > int(widget.cget("height")):
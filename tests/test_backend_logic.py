@@ -0,0 +1,176 @@
+"""
+Tests for creating, filling and reading a world database through backend_logic.
+"""
+
+import io
+import sqlite3
+
+import pytest
+from PIL import Image
+
+from app_files import backend_logic
+from app_files.database_schema import WorldBuilder
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    """
+    Creates a world database in a temporary folder and returns its url.
+    """
+
+    # Keep the databases out of the user's folder and answer the name prompt
+    monkeypatch.setattr(backend_logic, 'path', tmp_path)
+    monkeypatch.setattr(backend_logic.simpledialog, 'askstring', lambda *args, **kwargs: "Test World")
+
+    database_url = backend_logic.create_database()
+
+    yield database_url
+
+    # Release the file handles and forget the cached WorldBuilder
+    world_builder = backend_logic._WB_CACHE.pop(database_url, None)
+    if world_builder is not None:
+        world_builder.engine.dispose()
+
+
+def test_create_database(database_url, tmp_path):
+    assert database_url is not None
+    assert (tmp_path / 'test_world_database.db').is_file()
+
+    # The world row holds the entered name
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert session.query(WorldBuilder.World).one().name == "Test World"
+
+
+def test_add_and_get_entry(database_url):
+    data = {'name': "Alice", 'description': "A hero", 'stats': "", 'tags': "hero, city"}
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        backend_logic.add_data_to_table(session, 'characters', data, database_url)
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        entry = backend_logic.get_data_for_entry(session, "Alice", database_url)
+
+        # One tag row is stored per entry
+        assert session.query(WorldBuilder.Tag).filter_by(entry_name="Alice").count() == 1
+
+    assert entry['name'] == "Alice"
+    assert entry['description'] == "A hero"
+    assert entry['tags'] == "hero, city"
+
+
+
+def test_tags_are_normalised(database_url):
+    data = {'name': "Bob", 'description': "", 'stats': "", 'tags': " orc,orc ,, city , orc"}
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        backend_logic.add_data_to_table(session, 'characters', data, database_url)
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.get_data_for_entry(session, "Bob", database_url)['tags'] == "orc, city"
+
+def test_add_existing_entry(database_url):
+    data = {'name': "Alice", 'description': "A hero", 'stats': "", 'tags': ""}
+    changed = {**data, 'description': "A villain"}
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.add_data_to_table(session, 'characters', data, database_url) == 'added'
+
+        # Duplicates are skipped unless an update is asked for
+        assert backend_logic.add_data_to_table(session, 'characters', changed, database_url) == 'exists'
+        assert backend_logic.add_data_to_table(session, 'characters', changed, database_url,
+            on_conflict='update') == 'updated'
+
+        with pytest.raises(backend_logic.EntryExistsError):
+            backend_logic.add_data_to_table(session, 'characters', changed, database_url, on_conflict='error')
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.get_data_for_entry(session, "Alice", database_url)['description'] == "A villain"
+
+def test_get_missing_entry(database_url):
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.get_data_for_entry(session, "Nobody", database_url) is None
+
+
+def test_create_existing_database(database_url, monkeypatch):
+    data = {'name': "Alice", 'description': "A hero", 'stats': "", 'tags': ""}
+    errors = []
+    monkeypatch.setattr(backend_logic.messagebox, 'showerror', lambda *args, **kwargs: errors.append(args))
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        backend_logic.add_data_to_table(session, 'characters', data, database_url)
+
+    # A second world with the same name is refused and the first one keeps its entries
+    assert backend_logic.create_database() is None
+    assert errors
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.get_data_for_entry(session, "Alice", database_url)['name'] == "Alice"
+
+
+def test_thumbnail_created_only_when_written(database_url, monkeypatch):
+    buffer = io.BytesIO()
+    Image.new('RGB', (400, 300), 'red').save(buffer, 'PNG')
+    data = {'name': "Alice", 'description': "", 'stats': "", 'tags': "", 'image_data': buffer.getvalue()}
+
+    # Count the thumbnails made
+    calls = []
+    create_thumbnail = backend_logic.create_thumbnail
+    monkeypatch.setattr(backend_logic, 'create_thumbnail',
+        lambda image_data: calls.append(image_data) or create_thumbnail(image_data))
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        backend_logic.add_data_to_table(session, 'characters', data, database_url)
+        assert len(calls) == 1
+
+        # A skipped duplicate makes no thumbnail, an update makes one
+        backend_logic.add_data_to_table(session, 'characters', data, database_url)
+        assert len(calls) == 1
+        backend_logic.add_data_to_table(session, 'characters', data, database_url, on_conflict='update')
+        assert len(calls) == 2
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        thumb_data = backend_logic.get_data_for_entry(session, "Alice", database_url)['thumb_data']
+
+    with Image.open(io.BytesIO(thumb_data)) as thumbnail:
+        assert thumbnail.size == (200, 150)
+
+
+def test_upgrade_renames_duplicate_names(database_url, tmp_path):
+    database_path = tmp_path / 'test_world_database.db'
+
+    # Turn the database into one from before names were unique, with two entries called Alice
+    world_builder = backend_logic._WB_CACHE.pop(database_url)
+    world_builder.engine.dispose()
+    WorldBuilder._created.discard(database_url)
+
+    connection = sqlite3.connect(database_path)
+    with connection:
+        connection.execute("DROP INDEX ix_characters_name")
+        connection.execute("INSERT INTO characters (id, name, tags) VALUES (1, 'Alice', ''), (2, 'Alice', '')")
+        connection.execute("INSERT INTO tags (entry_name, entry_location, entry_table, entry_id) "
+            "VALUES ('Alice', 'characters/1', 'characters', 1), ('Alice', 'characters/2', 'characters', 2)")
+        connection.execute("PRAGMA user_version = 0")
+    connection.close()
+
+    data = {'name': "Bob", 'description': "", 'stats': "", 'tags': ""}
+
+    # Opening the database renames the second Alice and writes work again
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert backend_logic.add_data_to_table(session, 'characters', data, database_url) == 'added'
+        assert backend_logic.get_data_for_entry(session, "Alice", database_url)['id'] == 1
+        assert backend_logic.get_data_for_entry(session, "Alice (2)", database_url)['id'] == 2
+
+
+def test_open_current_database_skips_upgrade(database_url, monkeypatch):
+
+    # Reopen the database as a new process would
+    backend_logic._WB_CACHE.pop(database_url).engine.dispose()
+    WorldBuilder._created.discard(database_url)
+
+    def upgrade_schema(self):
+        raise AssertionError("upgrade_schema ran on an up to date database")
+
+    monkeypatch.setattr(WorldBuilder, 'upgrade_schema', upgrade_schema)
+
+    with backend_logic.create_session_by_url(database_url) as session:
+        assert session.query(WorldBuilder.World).one().name == "Test World"
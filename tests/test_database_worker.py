@@ -0,0 +1,44 @@
+"""
+Tests for handing results and errors from the DatabaseWorker back to the main loop.
+"""
+
+import time
+
+from app_files.other_classes.database_worker import DatabaseWorker
+
+
+class FakeWidget:
+    """
+    Stands in for a Tk widget, running after() callbacks in place.
+    """
+
+    def after(self, interval, function, *args):
+        time.sleep(interval / 1000)
+        function(*args)
+
+    def winfo_exists(self):
+        return True
+
+
+def test_run_passes_result():
+    worker = DatabaseWorker()
+    results = []
+
+    worker.run(FakeWidget(), results.append, sum, (1, 2, 3))
+    worker.shutdown()
+
+    assert results == [6]
+
+
+def test_run_passes_error():
+    worker = DatabaseWorker()
+    results, errors = [], []
+
+    def fail():
+        raise RuntimeError("query failed")
+
+    worker.run(FakeWidget(), results.append, fail, error_callback=errors.append)
+    worker.shutdown()
+
+    assert results == []
+    assert [str(error) for error in errors] == ["query failed"]